@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import logging.config
+import os
 from typing import Any, Dict
 
 # -----------------------------
@@ -30,6 +31,11 @@ LOGGING_CONFIG: Dict[str, Any] = {
             "format": "%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
+        # Sans funcName/lineno ; setup_logging coupe alors aussi findCaller.
+        "compact": {
+            "format": "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        },
     },
     "handlers": {
         "console": {
@@ -45,12 +51,60 @@ LOGGING_CONFIG: Dict[str, Any] = {
 }
 
 
+_CONFIGURED = False
+
+
+def _resolve_formatter_name() -> str:
+    """
+    Choisit le formatter console selon la variable LOG_FORMAT.
+
+    - `compact` : sans fonction ni numéro de ligne, et sans la remontée de pile
+      (findCaller) qui les calcule (recommandé en production)
+    - autre / absent : `verbose`
+    """
+    requested = os.getenv("LOG_FORMAT", "").strip().lower()
+    return "compact" if requested == "compact" else "verbose"
+
+
 def setup_logging(level: int = logging.DEBUG) -> None:
-    """Initialise la configuration de logging de l'application."""
+    """
+    Initialise la configuration de logging de l'application.
+
+    Idempotent : `dictConfig` n'est exécuté qu'au premier appel. Les appels
+    suivants se contentent d'ajuster le niveau du logger racine, sans
+    reconstruire les handlers ni invalider le cache de tous les loggers.
+    """
+    global _CONFIGURED
+
+    root_logger = logging.getLogger()
+    if _CONFIGURED:
+        if root_logger.level != level:
+            root_logger.setLevel(level)
+            logging.getLogger(__name__).debug(
+                "Niveau de logging ajusté à %s.", logging.getLevelName(level)
+            )
+        return
+
     try:
+        formatter = _resolve_formatter_name()
         config = dict(LOGGING_CONFIG)
-        config["root"]["level"] = logging.getLevelName(level)
+        config["handlers"] = {
+            "console": {**LOGGING_CONFIG["handlers"]["console"], "formatter": formatter}
+        }
+        config["root"] = {**LOGGING_CONFIG["root"], "level": logging.getLevelName(level)}
+
+        if formatter == "compact":
+            # Logger._log n'appelle findCaller que si _srcfile est défini :
+            # sans lui, aucune remontée de pile par enregistrement.
+            logging._srcfile = None
+            # Mode production explicite : thread/processus ne sont pas affichés,
+            # inutile de les collecter.
+            logging.logThreads = False
+            logging.logProcesses = False
+            logging.logMultiprocessing = False
+
         logging.config.dictConfig(config)
+        _CONFIGURED = True
 
         logger = logging.getLogger(__name__)
         logger.debug("Logging initialisé (sans coloration ANSI).")
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -28,30 +29,35 @@ def _load_dotenv_if_present(env_file: str | Path | None = None) -> None:
 
     logger.debug("Recherche d'un fichier .env local à charger: %s", env_path)
 
-    if not env_path.exists():
+    try:
+        env_file_obj = env_path.open("r", encoding="utf-8")
+    except FileNotFoundError:
         logger.info("Aucun fichier .env trouvé à %s, passage en mode variables système.", env_path)
         return
+    except OSError as exc:  # pragma: no cover - robustesse
+        logger.exception("Echec du chargement du fichier .env: %s", exc)
+        raise RuntimeError(f"Erreur lors du chargement du fichier .env: {exc}") from exc
 
     try:
-        for line_no, raw_line in enumerate(env_path.read_text(encoding="utf-8").splitlines(), start=1):
-            line = raw_line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                logger.debug("Ligne %d ignorée dans .env (vide ou commentaire).", line_no)
-                continue
-
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-
-            if not key:
-                logger.warning("Ligne %d du .env ignorée (clé vide).", line_no)
-                continue
-
-            if os.getenv(key) is None:
-                os.environ[key] = value
-                logger.debug("Variable %s chargée depuis .env.", key)
-            else:
-                logger.debug("Variable %s déjà définie dans l'environnement, .env laissé intact.", key)
+        with env_file_obj:
+            for line_no, raw_line in enumerate(env_file_obj, start=1):
+                line = raw_line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    logger.debug("Ligne %d ignorée dans .env (vide ou commentaire).", line_no)
+                    continue
+
+                key, value = line.split("=", 1)
+                key = key.strip()
+
+                if not key:
+                    logger.warning("Ligne %d du .env ignorée (clé vide).", line_no)
+                    continue
+
+                if os.getenv(key) is None:
+                    os.environ[key] = value.strip()
+                    logger.debug("Variable %s chargée depuis .env.", key)
+                else:
+                    logger.debug("Variable %s déjà définie dans l'environnement, .env laissé intact.", key)
 
         logger.info("Chargement du fichier .env terminé.")
     except Exception as exc:  # pragma: no cover - robustesse
@@ -59,10 +65,10 @@ def _load_dotenv_if_present(env_file: str | Path | None = None) -> None:
         raise RuntimeError(f"Erreur lors du chargement du fichier .env: {exc}") from exc
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
-    Configuration applicative centrale.
+    Configuration applicative centrale (immuable, partagée par tout le process).
 
     - gemini_api_key  : clé API Gemini (obligatoire aujourd'hui)
     - gemini_model    : nom du modèle Gemini
@@ -71,6 +77,7 @@ class Settings:
     gemini_model: str = "gemini-3-pro-preview"
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
     """
     Charge la configuration à partir des variables d’environnement.
@@ -79,6 +86,10 @@ def load_settings() -> Settings:
     - GEMINI_API_KEY  (obligatoire)
     - GEMINI_MODEL    (optionnelle)
 
+    Le résultat est mis en cache pour la durée du process : les appels
+    suivants renvoient la même instance sans relire l'environnement
+    (voir `reset_settings_cache` pour forcer un rechargement).
+
     Lève RuntimeError en cas de problème bloquant
     et loggue en détail l’erreur.
     """
@@ -95,8 +106,8 @@ def load_settings() -> Settings:
 
     try:
         # GEMINI
-        gemini_key = os.getenv("GEMINI_API_KEY")
-        if gemini_key is None or not gemini_key.strip():
+        gemini_key = (os.getenv("GEMINI_API_KEY") or "").strip()
+        if not gemini_key:
             logger.error(
                 "La variable d'environnement GEMINI_API_KEY est manquante ou vide."
             )
@@ -106,9 +117,8 @@ def load_settings() -> Settings:
             )
 
         gemini_model_env = os.getenv("GEMINI_MODEL")
-        if gemini_model_env is not None and gemini_model_env.strip():
-            gemini_model = gemini_model_env.strip()
-        else:
+        gemini_model = (gemini_model_env or "").strip()
+        if not gemini_model:
             gemini_model = "gemini-3-pro-preview"
             if gemini_model_env is not None:
                 logger.warning(
@@ -117,7 +127,7 @@ def load_settings() -> Settings:
                 )
 
         settings = Settings(
-            gemini_api_key=gemini_key.strip(),
+            gemini_api_key=gemini_key,
             gemini_model=gemini_model,
         )
 
@@ -133,3 +143,9 @@ def load_settings() -> Settings:
         raise RuntimeError(
             f"Erreur inattendue lors du chargement de la configuration: {exc}"
         ) from exc
+
+
+def reset_settings_cache() -> None:
+    """Vide le cache de `load_settings` (tests, rechargement de configuration)."""
+    load_settings.cache_clear()
+    logger.debug("Cache des Settings vidé.")
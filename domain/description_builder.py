@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from domain.pricing import get_retail_price_range
@@ -9,93 +10,364 @@ from domain.pricing import get_retail_price_range
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Constantes (compilées une seule fois au chargement du module)
+# ---------------------------------------------------------------------------
+
+_MODEL_NUMBER_RE = re.compile(r"(\d{3})")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_PERCENT_SPACING_RE = re.compile(r"(\d)\s*%\s*")
+_PERCENT_TOKEN_RE = re.compile(r"\b\d+\s*%\s*")
+_PARENTHESES_RE = re.compile(r"\((?:[^)(]+|\([^)(]*\))*\)")
+_DASH_SEPARATOR_RE = re.compile(r"\s*-\s*")
+_FIBER_PERCENT_RE = re.compile(r"(\d+)\s*%\s*([A-Za-zÀ-ÿ]+)", re.IGNORECASE)
+_PERCENT_LINE_RE = re.compile(r"\d+\s*%\s*[A-Za-zÀ-ÿ'’\- ]+")
+# Bornes des chemins rapides de _format_percent (entiers exacts en float)
+_PERCENT_FAST_PATH_MAX = 2**53
+_PERCENT_FAST_PATH_DIGITS = 15
+# Col Carhartt : (mot-clé, type) testés dans l'ordre, puis indices de velours côtelé
+_COLLAR_TYPES = (
+    ("chemise", "chemise"),
+    ("montant", "montant"),
+    ("teddy", "teddy"),
+    ("officier", "officier"),
+)
+_COLLAR_CORDUROY_KEYS = ("velours", "côtel", "cotele", "corduroy")
+# Tailles Carhartt : marqueur (minuscules) -> taille normalisée, testés dans l'ordre
+_CARHARTT_SIZE_MAP = {
+    "xs": "XS",
+    "extra small": "XS",
+    "x-small": "XS",
+    "small": "S",
+    "s": "S",
+    "medium": "M",
+    "m": "M",
+    "large": "L",
+    "l": "L",
+    "x-large": "XL",
+    "xl": "XL",
+    "xxl": "XXL",
+    "2xl": "XXL",
+    "xxxl": "XXXL",
+    "3xl": "XXXL",
+}
+
+# Nettoyage des segments matière Carhartt
+_CARHARTT_COMPOSITION_NOTE_RE = re.compile(r"la composition indiquée[^:]*:", re.IGNORECASE)
+_CARHARTT_MATERIAL_PREFIX_RE = re.compile(
+    r"^(composition|matiere|material)[:\-]?\s*", re.IGNORECASE
+)
+
+# Lignes de pied de page à retirer des descriptions (marque, couleur, taille, SKU)
+# (marque/couleur/taille exigent un ":", "sku" suffit seul)
+_FOOTER_LINE_RE = re.compile(
+    r"^[#*\-\s]*(?P<label>(?:marque|couleur|taille)(?=\s*:)|sku)", re.IGNORECASE
+)
+# Libellé seul sur sa ligne (ses ":" sont sur une ligne suivante)
+_FOOTER_BARE_LABEL_RE = re.compile(r"\s*(?:marque|couleur|taille|sku)", re.IGNORECASE)
+# Normalisation caractère par caractère du texte IA (espaces insécables)
+_DESCRIPTION_CHAR_MAP = str.maketrans({"\u00A0": " "})
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# Pré-filtre : sans aucun libellé, aucune ligne n'est à retirer
+_FOOTER_LABEL_RE = re.compile(r"marque|couleur|taille|sku", re.IGNORECASE)
+_TRAILING_BLANKS_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+
+# Termes de défauts adoucis (une seule alternation insensible à la casse)
+_DEFECT_SOFTENING_RE = re.compile(r"généralisé|generalise", re.IGNORECASE)
+_DEFECT_SOFTENED_TERM = "visible"
+
+# Classification des coupes (une alternation = un seul parcours de la chaîne)
+# (é accepté là où le motif contient un "e" : pas de translittération préalable)
+_BOOT_HASHTAG_RE = re.compile(r"boot[ \-]?cut|flar[eé]|curv[eéy]")
+_SKINNY_FIT_RE = re.compile(r"skinny|slim")
+_STRAIGHT_HASHTAG_RE = re.compile(r"straight|droit")
+_STRAIGHT_FIT_RE = re.compile(r"straight|droit|mom|boyfriend|girlfriend|regular|tapered")
+_FLARED_FIT_RE = re.compile(
+    r"boot|flare|évas|evase|curv[ey]|wide|baggy|loose|relaxed|barrel"
+)
+
+# Tokens de modèle ignorés dans les hashtags
+_MODEL_DROP_MARKERS = frozenset({"demi", "curve", "curvy", "cut"})
+# Libellés des valeurs canoniques de rise_type
+_RISE_LABELS = {
+    "low": "taille basse",
+    "ultra_low": "taille basse",
+    "high": "taille haute",
+    "mid": "taille moyenne",
+}
+
+# Tables de suppression de caractères pour les hashtags (une seule passe C)
+_MODEL_TOKEN_STRIP = str.maketrans("", "", "'-")
+_FIT_TAG_CHAR_MAP = str.maketrans({"é": "e", " ": None, "/": None})
+
+# Champs texte lus par build_jean_levis_description
+_LEVIS_TEXT_KEYS = (
+    "brand",
+    "model",
+    "fit",
+    "color",
+    "size_fr",
+    "size_us",
+    "length",
+    "gender",
+    "sku",
+    "order_id",
+)
+
+# Champs texte lus par build_pull_description
+_PULL_TEXT_KEYS = (
+    "brand",
+    "garment_type",
+    "gender",
+    "neckline",
+    "pattern",
+    "material",
+    "size_source",
+    "measurement_mode",
+    "sku",
+    "order_id",
+)
+
+# Champs texte lus par build_jacket_carhart_description
+_CARHARTT_TEXT_KEYS = (
+    "brand",
+    "model",
+    "size",
+    "color",
+    "gender",
+    "lining",
+    "patch_material",
+    "collar",
+    "zip_material",
+    "origin_country",
+    "sku",
+    "order_id",
+    "exterior",
+    "sleeve_lining",
+)
+
+# Hashtags fixes, en tête de liste
+_LEVIS_BASE_TAGS = ("#jeanlevis", "#jeandenim")
+_LEVIS_DESCRIPTION_BASE_TAGS = ("#vintage", "#levis", *_LEVIS_BASE_TAGS)
+_TOMMY_BASE_TAGS = (
+    "#tommyhilfiger",
+    "#pulltommy",
+    "#tommy",
+    "#pullfemme",
+    "#modefemme",
+    "#preloved",
+)
+
+# Libellés de fibres (étiquettes multilingues) -> libellé français
+_FIBER_ALIASES = {
+    "cotton": "coton",
+    "cotton.": "coton",
+    "cot": "coton",
+    "cotone": "coton",
+    "wool": "laine",
+    "lana": "laine",
+    "angora": "angora",
+    "angora rabbit": "angora",
+    "rabbit angora": "angora",
+    "rabbit": "angora",
+    "lapin": "angora",
+    "lapin angora": "angora",
+    "mohair": "mohair",
+    "lana de cabra": "mohair",
+    "lambswool": "laine d'agneau",
+}
+
+# Fin de phrase "confort" des pulls selon la matière dominante (ordre = priorité)
+_PULL_COMFORT_PHRASES = {
+    "angora": "pour une douceur légère et élégante",
+    "laine": "pour une chaleur douce et confortable",
+    "coton": "pour un confort respirant au quotidien",
+}
+_PULL_DEFAULT_COMFORT = "pour un look iconique et confortable"
+
+# Fragments de texte statiques (identiques d'une annonce à l'autre)
+_COMPOSITION_FALLBACK = "Composition non lisible (voir étiquettes en photo)."
+
+_LEVIS_DENIM_SENTENCE = "Toile de denim souple, bien tenue et confortable."
+_LEVIS_COLOR_FALLBACK = "Sa couleur intemporelle s'intègre facilement à une garde-robe."
+_LEVIS_SIZE_FALLBACK = "👖 Taille : voir photos"
+_LEVIS_SIZE_NOTE = (
+    "*Les variations et écarts de mesure entre les tailles US et FR sont dus aux "
+    "différentes proportions d'élasthanne et/ou viscose présentes dans le tissu."
+)
+_LEVIS_STATE_PERFECT = "👍 Très bon état : article impeccable !"
+_LEVIS_MEASURES_LINE = (
+    "🔎 Consultez les photos pour obtenir les mesures précises et la composition détaillée."
+)
+_LEVIS_SHIPPING_LINE = "📦 Envoi rapide et soigné"
+_LEVIS_CTA_LOT_LINE = "💡 Jusqu'à 20% de réduction sur les lots, pensez y !"
+_LEVIS_CTA_SIZE_PREFIX = "✨ Retrouvez tous mes articles Levi's à votre taille ici 👉 "
+
+_PULL_LOGISTICS_SENTENCE = (
+    "📏 Mesures détaillées visibles en photo pour plus de précisions.\n"
+    "📦 Envoi rapide et soigné."
+)
+_PULL_CTA_LOT_LINE = (
+    "💡 Pensez à faire un lot pour profiter d’une réduction supplémentaire "
+    "et économiser des frais d’envoi !"
+)
+
+_CARHARTT_STATE_PERFECT = (
+    "Très bon état, aucun défaut majeur visible. Veste propre et bien conservée (voir photos)."
+)
+_CARHARTT_LOGISTICS_SENTENCE = "📏 Mesures détaillées visibles en photo pour plus de précisions."
+_CARHARTT_SHIPPING_SENTENCE = "📦 Envoi rapide et soigné."
+_CARHARTT_BUNDLE_SENTENCE = (
+    "💡 Pensez à faire un lot pour bénéficier d'une réduction et économiser sur les frais d'envoi."
+)
+_CARHARTT_GENERAL_TAG = "#durin31jc"
+_CARHARTT_BASE_TAGS = (
+    "#carhartt",
+    "#jacket",
+    "#workwear",
+    "#vintage",
+    "#detroitjacket",
+    "#detroit",
+)
+
+# Préfixes du tag taille selon le compte Vinted (#GC_fr36 ou #LG_fr36)
+_LEVIS_HOMME_SIZE_TAG_PREFIX = "#GC_fr"
+_LEVIS_FEMME_SIZE_TAG_PREFIX = "#LG_fr"
+
+
 # ---------------------------------------------------------------------------
 # Helpers internes
 # ---------------------------------------------------------------------------
 
 
 def _safe_clean(value: Optional[Any]) -> str:
-    try:
-        if value is None:
-            return ""
-        text = str(value).strip()
-        return text
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_safe_clean: erreur sur %r -> %s", value, exc)
+    if value is None:
         return ""
+    return str(value).strip()
+
+
+def _clean_features(features: Dict[str, Any], keys: tuple[str, ...]) -> Dict[str, str]:
+    """Applique `_safe_clean` à plusieurs clés de `features` en une passe."""
+    cleaned: Dict[str, str] = {}
+    get = features.get
+    for key in keys:
+        value = get(key)
+        if type(value) is str:
+            cleaned[key] = value.strip()
+        elif value is None:
+            cleaned[key] = ""
+        else:
+            cleaned[key] = str(value).strip()
+    return cleaned
 
 
 def _format_percent(value: Optional[Any]) -> Optional[int]:
+    # Chemins rapides limités aux valeurs exactement représentables en float :
+    # au-delà, on passe par int(float(...)) comme le cas général (None si
+    # dépassement de capacité).
+    if type(value) is int and -_PERCENT_FAST_PATH_MAX <= value <= _PERCENT_FAST_PATH_MAX:
+        return value
+    if value is None or value == "":
+        return None
+    if type(value) is str and len(value) <= _PERCENT_FAST_PATH_DIGITS and value.isdecimal():
+        # "98" : conversion directe, sans passer par float
+        return int(value)
     try:
-        if value is None or value == "":
-            return None
         return int(float(value))
-    except Exception as exc:  # pragma: no cover - defensive
+    except (TypeError, ValueError, OverflowError) as exc:
         logger.warning("_format_percent: conversion impossible pour %r (%s)", value, exc)
         return None
 
 
-def _format_rise_label(rise_type: Optional[str], rise_cm: Optional[Any]) -> str:
-    try:
-        if rise_type:
-            normalized = rise_type.strip().lower()
-        else:
-            normalized = ""
+def _format_rise_label(rise_type: Optional[Any], rise_cm: Optional[Any]) -> str:
+    # Les entrées brutes (IA, formulaire) sont ramenées à (str, float|None)
+    # avant le cache : clés hashables, et "High"/"high " ou 25/"25" partagent
+    # la même entrée. Un rise_type non textuel (nombre, dict...) est ignoré,
+    # comme une valeur absente : seul rise_cm décide alors.
+    normalized = rise_type.strip().lower() if isinstance(rise_type, str) else ""
 
-        if normalized in {"low", "ultra_low"} or "basse" in normalized:
+    value: Optional[float] = None
+    if rise_cm is not None:
+        try:
+            value = float(rise_cm)
+        except (TypeError, ValueError, OverflowError):
+            logger.debug("_format_rise_label: rise_cm non exploitable: %r", rise_cm)
+
+    return _rise_label(normalized, value)
+
+
+@lru_cache(maxsize=64)
+def _rise_label(normalized: str, rise_cm: Optional[float]) -> str:
+    """Libellé de hauteur de taille pour des entrées déjà normalisées (mise en cache)."""
+    label = _RISE_LABELS.get(normalized)
+    if label:
+        return label
+    # Valeurs libres (ex. "Taille haute", "moyenne")
+    if "basse" in normalized:
+        return "taille basse"
+    if "haute" in normalized:
+        return "taille haute"
+    if "moy" in normalized:
+        return "taille moyenne"
+
+    if rise_cm is not None:
+        if rise_cm < 23:
             return "taille basse"
-        if normalized == "high" or "haute" in normalized:
+        if rise_cm >= 26:
             return "taille haute"
-        if normalized == "mid" or "moy" in normalized:
-            return "taille moyenne"
-
-        if rise_cm is not None:
-            try:
-                value = float(rise_cm)
-                if value < 23:
-                    return "taille basse"
-                if value >= 26:
-                    return "taille haute"
-                return "taille moyenne"
-            except (TypeError, ValueError):
-                logger.debug("_format_rise_label: rise_cm non exploitable: %r", rise_cm)
 
-        return "taille moyenne"
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_format_rise_label: erreur inattendue %s", exc)
-        return "taille moyenne"
+    return "taille moyenne"
 
 
 def _build_composition(cotton_percent: Optional[Any], elasthane_percent: Optional[Any]) -> str:
-    try:
-        cotton_val = _format_percent(cotton_percent)
-        elas_val = _format_percent(elasthane_percent)
+    return _composition_sentence(
+        _format_percent(cotton_percent), _format_percent(elasthane_percent)
+    )
 
-        fibers: List[str] = []
-        if cotton_val is not None:
-            fibers.append(f"{cotton_val}% coton")
-        if elas_val is not None:
-            fibers.append(f"{elas_val}% élasthanne")
 
-        if fibers:
-            return "Composition : " + " et ".join(fibers) + "."
-        return "Composition non lisible (voir étiquettes en photo)."
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_build_composition: erreur %s", exc)
-        return "Composition non lisible (voir étiquettes en photo)."
+@lru_cache(maxsize=1024)
+def _composition_sentence(cotton_val: Optional[int], elas_val: Optional[int]) -> str:
+    """Phrase de composition pour des pourcentages déjà normalisés (mise en cache)."""
+    if cotton_val is not None and elas_val is not None:
+        return f"Composition : {cotton_val}% coton et {elas_val}% élasthanne."
+    if cotton_val is not None:
+        return f"Composition : {cotton_val}% coton."
+    if elas_val is not None:
+        return f"Composition : {elas_val}% élasthanne."
+    return _COMPOSITION_FALLBACK
 
 
 def _build_state_sentence(defects: Optional[str]) -> str:
-    try:
-        clean_defects = _normalize_defects(defects)
-        if not clean_defects:
-            return "Très bon état."
-        concise_state = f"Très bon état : {clean_defects} (voir photos)."
-        logger.info("_build_state_sentence: état décrit = %s", concise_state)
-        return concise_state
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_build_state_sentence: erreur %s", exc)
-        return "État non précisé (voir photos)."
+    return _state_sentence(_safe_clean(defects))
+
+
+@lru_cache(maxsize=1024)
+def _state_sentence(defects_text: str) -> str:
+    """Phrase d'état pour un texte de défauts déjà nettoyé (mise en cache)."""
+    clean_defects = _normalize_defects(defects_text)
+    if not clean_defects:
+        return "Très bon état."
+    concise_state = f"Très bon état : {clean_defects} (voir photos)."
+    logger.debug("_build_state_sentence: état décrit = %s", concise_state)
+    return concise_state
+
+
+@lru_cache(maxsize=1024)
+def _compact_tag_token(value: str) -> str:
+    """Forme hashtag d'un libellé : minuscules, sans espaces ("Bleu clair" -> "bleuclair")."""
+    return value.lower().replace(" ", "")
+
+
+@lru_cache(maxsize=256)
+def _fit_tag_token(fit: str) -> str:
+    fit_key = fit.lower().strip()
+    if _BOOT_HASHTAG_RE.search(fit_key):
+        return "bootcut"
+    if _SKINNY_FIT_RE.search(fit_key):
+        return "skinny"
+    if _STRAIGHT_HASHTAG_RE.search(fit_key):
+        return "straightdroit"
+    return fit_key.translate(_FIT_TAG_CHAR_MAP)
 
 
 def _build_hashtags(
@@ -112,327 +384,236 @@ def _build_hashtags(
     vinted_account_tag: str = "",
     sku_order_tag: str = "",
 ) -> str:
-    try:
-        tokens: List[str] = []
-
-        def add(token: str) -> None:
-            if token and token not in tokens:
-                tokens.append(token)
-
-        brand_token = brand.lower().replace("'", "") if brand else "levis"
-        add(f"#{brand_token}")
-        add("#jeanlevis")
-        add("#jeandenim")
-
-        if gender:
-            gender_token = gender.lower().replace(" ", "")
-            add(f"#levis{gender_token}")
-
-        if model:
-            model_low = model.lower().strip()
-            model_number = ""
-            try:
-                import re  # local import pour rester défensif
-
-                match = re.search(r"(\d{3})", model_low)
+    # Dict utilisé comme ensemble ordonné : dédoublonnage O(1), ordre d'insertion conservé
+    tokens: Dict[str, None] = {}
+    add = tokens.setdefault
+
+    brand_token = brand.lower().replace("'", "") if brand else "levis"
+    add(f"#{brand_token}")
+    tokens.update(dict.fromkeys(_LEVIS_BASE_TAGS))
+
+    if gender:
+        gender_token = _compact_tag_token(gender)
+        add(f"#levis{gender_token}")
+
+    if model:
+        model_low = model.lower().strip()
+        model_number = ""
+        model_tokens: List[str] = []
+        # Une seule passe : le numéro de modèle (3 chiffres consécutifs, jamais à
+        # cheval sur un séparateur) est cherché token par token.
+        for token in model_low.replace("/", " ").split():
+            if not model_number:
+                match = _MODEL_NUMBER_RE.search(token)
                 if match:
                     model_number = match.group(1)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning("_build_hashtags: extraction modèle échouée (%s)", exc)
-
-            if model_number:
-                add(f"#levis{model_number}")
-                add(f"#{model_number}")
-
-            model_tokens: List[str] = []
-            drop_markers = {"demi", "curve", "curvy", "cut"}
-            for token in model_low.replace("/", " ").split():
-                token_clean = token.replace("'", "").replace("-", "")
-                if token_clean == model_number or token_clean.isdigit():
-                    continue
-                if token_clean in drop_markers:
-                    logger.debug(
-                        "_build_hashtags: token modèle ignoré (marker): %s", token
-                    )
-                    continue
-                if token_clean:
-                    model_tokens.append(token_clean)
-
-            try:
-                tokens_lower = {t.lower() for t in model_tokens}
-                if "super" in tokens_lower and "skinny" in tokens_lower:
-                    add("#superskinny")
-                    model_tokens = [t for t in model_tokens if t.lower() not in {"super", "skinny"}]
-                if "super" in tokens_lower and "slim" in tokens_lower:
-                    add("#superslim")
-                    model_tokens = [t for t in model_tokens if t.lower() not in {"super", "slim"}]
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.debug("_build_hashtags: combinaison tokens modèle impossible (%s)", exc)
-
-            for token_clean in model_tokens:
+            token_clean = token.translate(_MODEL_TOKEN_STRIP)
+            if token_clean.isdigit():
+                continue
+            if token_clean in _MODEL_DROP_MARKERS:
+                logger.debug(
+                    "_build_hashtags: token modèle ignoré (marker): %s", token
+                )
+                continue
+            if token_clean:
+                model_tokens.append(token_clean)
+
+        if model_number:
+            add(f"#levis{model_number}")
+            add(f"#{model_number}")
+
+        # Les tokens sont déjà en minuscules (issus de model_low).
+        token_set = set(model_tokens)
+        merged_tokens: set[str] = set()
+        if "super" in token_set:
+            if "skinny" in token_set:
+                add("#superskinny")
+                merged_tokens.update(("super", "skinny"))
+            if "slim" in token_set:
+                add("#superslim")
+                merged_tokens.update(("super", "slim"))
+
+        for token_clean in model_tokens:
+            if token_clean not in merged_tokens:
                 add(f"#{token_clean}")
 
-        if fit:
-            fit_low = fit.lower().strip()
-            fit_key = fit_low.replace("é", "e")
-            boot_markers = {"bootcut", "boot cut", "boot-cut", "flare", "curve", "curvy"}
-            if any(marker in fit_key for marker in boot_markers):
-                fit_token = "bootcut"
-            elif "skinny" in fit_key or "slim" in fit_key:
-                fit_token = "skinny"
-            elif "straight" in fit_key or "droit" in fit_key:
-                fit_token = "straightdroit"
-            else:
-                fit_token = fit_key.replace(" ", "").replace("/", "")
-            add(f"#{fit_token}jean")
+    if fit:
+        add(f"#{_fit_tag_token(fit)}jean")
 
-        if color:
-            color_clean = color.lower().replace(" ", "")
-            add(f"#jean{color_clean}")
+    if color:
+        color_clean = _compact_tag_token(color)
+        add(f"#jean{color_clean}")
 
-        rise_clean = rise_label.lower().replace(" ", "") if rise_label else ""
-        if rise_clean:
-            add(f"#{rise_clean}")
+    rise_clean = _compact_tag_token(rise_label) if rise_label else ""
+    if rise_clean:
+        add(f"#{rise_clean}")
 
-        if size_fr:
-            add(f"#fr{size_fr.lower()}")
-        if size_us:
-            add(f"#w{size_us.lower().replace('w', '')}")
-        if length:
-            add(f"#l{length.lower().replace('l', '')}")
+    if size_fr:
+        add(f"#fr{size_fr.lower()}")
+    if size_us:
+        add(f"#w{size_us.lower().replace('w', '')}")
+    if length:
+        add(f"#l{length.lower().replace('l', '')}")
 
-        # Ajouter le tag de taille avec préfixe compte (#GC_fr36 ou #LG_fr36)
-        if size_tag:
-            add(size_tag)
+    # Ajouter le tag de taille avec préfixe compte (#GC_fr36 ou #LG_fr36)
+    if size_tag:
+        add(size_tag)
 
-        # Ajouter le tag du compte Vinted (#gentlemen_corner ou #ladies_and_gentlemen)
-        if vinted_account_tag:
-            add(vinted_account_tag)
+    # Ajouter le tag du compte Vinted (#gentlemen_corner ou #ladies_and_gentlemen)
+    if vinted_account_tag:
+        add(vinted_account_tag)
 
-        if sku_order_tag:
-            add(sku_order_tag)
+    if sku_order_tag:
+        add(sku_order_tag)
 
-        return " ".join(tokens)
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_build_hashtags: erreur %s", exc)
-        return ""
+    return " ".join(tokens)
 
 
 def _normalize_defects(defects: Optional[str]) -> str:
-    try:
-        base = _safe_clean(defects)
-        if not base:
-            return ""
+    base = _safe_clean(defects)
+    if not base:
+        return ""
 
-        lowered = base.lower()
-        if "voir photos" in lowered:
-            cut = lowered.split("voir photos", 1)[0].strip()
-        else:
-            cut = base.strip()
+    lowered = base.lower()
+    if "voir photos" in lowered:
+        cut = lowered.split("voir photos", 1)[0].strip()
+    else:
+        cut = base.strip()
 
-        cleaned = cut.rstrip(". ,;")
-        softened = _soften_defect_terms(cleaned)
-        return softened
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_normalize_defects: erreur %s", exc)
-        return ""
+    cleaned = cut.rstrip(". ,;")
+    softened = _soften_defect_terms(cleaned)
+    return softened
 
 
 def _soften_defect_terms(defects: str) -> str:
     """Ajuste certains termes pour des formulations moins anxiogènes."""
-    try:
-        text = defects
-        if not text:
-            return ""
-
-        replacements = {"généralisé": "visible", "generalise": "visible"}
-        for needle, replacement in replacements.items():
-            if needle in text.lower():
-                logger.info(
-                    "_soften_defect_terms: remplacement '%s' -> '%s'", needle, replacement
-                )
-                text = re.sub(needle, replacement, text, flags=re.IGNORECASE)
+    if not defects:
+        return ""
 
-        return text
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_soften_defect_terms: erreur %s", exc)
-        return defects or ""
+    text, count = _DEFECT_SOFTENING_RE.subn(_DEFECT_SOFTENED_TERM, defects)
+    if count:
+        logger.debug(
+            "_soften_defect_terms: %d terme(s) remplacé(s) par '%s'", count, _DEFECT_SOFTENED_TERM
+        )
+    return text
 
 
 def _normalize_percentage_spacing(text: str) -> str:
-    try:
-        normalized = re.sub(r"(\d)\s*%\s*", r"\1 % ", text)
-        normalized = re.sub(r"\s{2,}", " ", normalized)
-        return normalized.strip()
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.debug("_normalize_percentage_spacing: normalisation impossible (%s)", exc)
-        return text
+    normalized = _PERCENT_SPACING_RE.sub(r"\1 % ", text)
+    normalized = _MULTI_SPACE_RE.sub(" ", normalized)
+    return normalized.strip()
 
 
 def _clean_carhartt_material_segment(value: Optional[Any]) -> str:
     """Nettoie un segment décrivant une matière pour l'affichage Carhartt."""
 
-    try:
-        base = _safe_clean(value)
-        if not base:
-            return ""
+    base = _safe_clean(value)
+    if not base:
+        return ""
 
-        cleaned = re.sub(
-            r"la composition indiquée[^:]*:", "", base, flags=re.IGNORECASE
-        )
-        cleaned = re.sub(
-            r"^(composition|matiere|material)[:\-]?\s*", "", cleaned, flags=re.IGNORECASE
-        )
-        cleaned = cleaned.strip(" .;:-")
+    cleaned = _CARHARTT_COMPOSITION_NOTE_RE.sub("", base)
+    cleaned = _CARHARTT_MATERIAL_PREFIX_RE.sub("", cleaned)
+    cleaned = cleaned.strip(" .;:-")
 
-        # enlève les tirets parasites du type "30 % - POLYESTER"
-        cleaned = re.sub(r"\s*-\s*", " ", cleaned)
+    # enlève les tirets parasites du type "30 % - POLYESTER"
+    cleaned = _DASH_SEPARATOR_RE.sub(" ", cleaned)
 
-        cleaned = _normalize_percentage_spacing(cleaned)
+    cleaned = _normalize_percentage_spacing(cleaned)
 
-        if cleaned:
-            logger.info(
-                "_clean_carhartt_material_segment: segment nettoyé='%s' (source=%s)",
-                cleaned,
-                value,
-            )
-        return cleaned
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("_clean_carhartt_material_segment: nettoyage impossible (%s)", exc)
-        return _safe_clean(value)
+    if cleaned:
+        logger.debug(
+            "_clean_carhartt_material_segment: segment nettoyé='%s' (source=%s)",
+            cleaned,
+            value,
+        )
+    return cleaned
 
 
 def _normalize_pull_size(size: Optional[str]) -> str:
-    try:
-        raw = _safe_clean(size).upper()
-        if not raw:
-            return ""
+    raw = _safe_clean(size).upper()
+    if not raw:
+        return ""
 
-        main_token = raw.split("/", 1)[0].strip()
-        if main_token:
-            return main_token
+    main_token = raw.split("/", 1)[0].strip()
+    if main_token:
+        return main_token
 
-        return raw
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("_normalize_pull_size: normalisation taille échouée (%s)", exc)
-        return _safe_clean(size)
+    return raw
 
 
 def _normalize_carhartt_size(size: Optional[str]) -> tuple[str, str, str]:
     """Renvoie (taille courte, taille affichée, token hashtag) avec journalisation."""
 
-    try:
-        raw = _safe_clean(size)
-        if not raw:
-            return "NC", "NC", "nc"
-
-        low = raw.lower()
-        base = raw.upper()
-
-        size_map = {
-            "xs": "XS",
-            "extra small": "XS",
-            "x-small": "XS",
-            "small": "S",
-            "s": "S",
-            "medium": "M",
-            "m": "M",
-            "large": "L",
-            "l": "L",
-            "x-large": "XL",
-            "xl": "XL",
-            "xxl": "XXL",
-            "2xl": "XXL",
-            "xxxl": "XXXL",
-            "3xl": "XXXL",
-        }
-
-        for marker, normalized in size_map.items():
-            if marker in low:
-                base = normalized
-                break
-
-        display = base if base == raw.strip().upper() else f"{base} ({raw})"
-        token = base.lower().replace(" ", "") or "nc"
-        logger.info(
-            "_normalize_carhartt_size: taille brute '%s' -> base=%s, display=%s, token=%s",
-            raw,
-            base,
-            display,
-            token,
-        )
-        return base, display, token
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_normalize_carhartt_size: échec normalisation (%s)", exc)
+    raw = _safe_clean(size)
+    if not raw:
         return "NC", "NC", "nc"
 
+    low = raw.lower()
+    base = raw.upper()
+
+    for marker, normalized in _CARHARTT_SIZE_MAP.items():
+        if marker in low:
+            base = normalized
+            break
+
+    display = base if base == raw.strip().upper() else f"{base} ({raw})"
+    token = base.lower().replace(" ", "") or "nc"
+    logger.debug(
+        "_normalize_carhartt_size: taille brute '%s' -> base=%s, display=%s, token=%s",
+        raw,
+        base,
+        display,
+        token,
+    )
+    return base, display, token
+
 
 def _strip_footer_lines(description: str) -> str:
-    try:
-        if not description:
-            return ""
+    if not description:
+        return ""
 
-        try:
-            description = description.replace("\u00A0", " ")
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.debug("_strip_footer_lines: normalisation espaces ignorée (%s)", exc)
-
-        filtered_lines: List[str] = []
-        for line in description.split("\n"):
-            lowered = line.strip().lower()
-            try:
-                import re
-
-                if re.match(r"^[#*\-\s]*marque\s*:", lowered):
-                    logger.debug("_strip_footer_lines: ligne marque supprimée: %s", line)
-                    continue
-                if re.match(r"^[#*\-\s]*couleur\s*:", lowered):
-                    logger.debug("_strip_footer_lines: ligne couleur supprimée: %s", line)
-                    continue
-                if re.match(r"^[#*\-\s]*taille\s*:", lowered):
-                    logger.debug("_strip_footer_lines: ligne taille supprimée: %s", line)
-                    continue
-                if re.match(r"^[#*\-\s]*sku", lowered):
-                    logger.debug("_strip_footer_lines: ligne SKU supprimée: %s", line)
-                    continue
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning("_strip_footer_lines: regex footer ignoré (%s)", exc)
-
-            filtered_lines.append(line)
-
-        cleaned = "\n".join(filtered_lines)
+    description = description.translate(_DESCRIPTION_CHAR_MAP)
 
-        try:
-            import re
+    if not _FOOTER_LABEL_RE.search(description):
+        # Rien à filtrer : seul le nettoyage des blancs s'applique, sans découpage.
+        return _BLANK_LINES_RE.sub("\n\n", _TRAILING_BLANKS_RE.sub("", description)).strip()
 
-            cleaned = re.sub(
-                r"(?im)^\s*(marque|couleur|taille|sku)\s*:[^\n]*$",
-                "",
-                cleaned,
-            )
-            cleaned = re.sub(
-                r"(?is)\n+\s*(marque|couleur|taille|sku)\s*:[^\n]*", "", cleaned
+    # Passe unique : filtrage des lignes de pied de page, suppression des blancs
+    # de fin de ligne, fusion des lignes vides consécutives et détection d'un
+    # libellé séparé de ses ":" par un retour à la ligne (ex. "Marque\n: Levi's").
+    kept_lines: List[str] = []
+    bare_label_at: Optional[int] = None
+    for raw_line in description.split("\n"):
+        footer_match = _FOOTER_LINE_RE.match(raw_line)
+        if footer_match:
+            logger.debug(
+                "_strip_footer_lines: ligne %s supprimée: %s",
+                footer_match.group("label").lower(),
+                raw_line,
             )
+            continue
 
-            final_lines: List[str] = []
-            blank_seen = False
-            for raw_line in cleaned.split("\n"):
-                if not raw_line.strip():
-                    if not blank_seen:
-                        final_lines.append("")
-                        blank_seen = True
-                    continue
-                final_lines.append(raw_line.rstrip())
-                blank_seen = False
-
-            cleaned = "\n".join(final_lines).strip()
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("_strip_footer_lines: nettoyage étendu ignoré (%s)", exc)
+        line = raw_line.rstrip()
+        if bare_label_at is not None and line.lstrip().startswith(":"):
+            logger.debug("_strip_footer_lines: libellé sur deux lignes supprimé: %s", line)
+            del kept_lines[bare_label_at:]
+            kept_lines.append("")
+            bare_label_at = None
+            continue
 
-        return cleaned
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_strip_footer_lines: erreur %s", exc)
-        return description
+        if _FOOTER_BARE_LABEL_RE.fullmatch(line):
+            # Les lignes vides qui précèdent le libellé partent avec lui.
+            bare_label_at = len(kept_lines)
+            while bare_label_at and not kept_lines[bare_label_at - 1]:
+                bare_label_at -= 1
+        elif line:
+            bare_label_at = None
+        elif kept_lines and not kept_lines[-1]:
+            continue
+
+        kept_lines.append(line)
+
+    return "\n".join(kept_lines).strip()
 
 
 def _build_pull_composition(
@@ -442,153 +623,92 @@ def _build_pull_composition(
     angora_percent: Optional[Any] = None,
     manual_composition_text: Optional[str] = None,
 ) -> str:
-    try:
-        fibers: List[str] = []
-        seen: set[str] = set()
-
-        def _normalize_fiber_label(raw_label: str) -> str:
-            try:
-                aliases = {
-                    "cotton": "coton",
-                    "cotton.": "coton",
-                    "cot": "coton",
-                    "cotone": "coton",
-                    "wool": "laine",
-                    "lana": "laine",
-                    "angora": "angora",
-                    "angora rabbit": "angora",
-                    "rabbit angora": "angora",
-                    "rabbit": "angora",
-                    "lapin": "angora",
-                    "lapin angora": "angora",
-                    "mohair" : "mohair",
-                    "lana de cabra" : "mohair",
-                    "lambswool": "laine d'agneau",
-                }
-                cleaned = raw_label.strip(" .")
-                cleaned_lower = cleaned.lower()
-                return aliases.get(cleaned_lower, cleaned_lower)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.debug(
-                    "_build_pull_composition: normalisation matière échouée (%s)",
-                    exc,
-                )
-                return raw_label
-
-        def _add_fiber(label: str, percent: Optional[int]) -> None:
-            try:
-                label_clean = _safe_clean(label).lower()
-                if not label_clean:
-                    return
-                normalized_label = _normalize_fiber_label(label_clean)
-                key = (
-                    f"{percent}-{normalized_label}"
-                    if percent is not None
-                    else normalized_label
-                )
-                if key in seen:
-                    return
-                seen.add(key)
-                display = normalized_label.capitalize()
-                if percent is not None:
-                    fibers.append(f"{percent}% {display}")
-                else:
-                    fibers.append(display)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.debug(
-                    "_build_pull_composition: impossible d'ajouter %s (%s)",
-                    label,
-                    exc,
-                )
+    fibers: List[str] = []
+    seen: set[str] = set()
+
+    def _add_fiber(label: str, percent: Optional[int]) -> None:
+        label_clean = _safe_clean(label).lower()
+        if not label_clean:
+            return
+        # Normalisation en ligne (alias FR) : pas d'appel imbriqué par fibre.
+        label_clean = label_clean.strip(" .")
+        normalized_label = _FIBER_ALIASES.get(label_clean, label_clean)
+        key = (
+            f"{percent}-{normalized_label}"
+            if percent is not None
+            else normalized_label
+        )
+        if key in seen:
+            return
+        seen.add(key)
+        display = normalized_label.capitalize()
+        if percent is not None:
+            fibers.append(f"{percent}% {display}")
+        else:
+            fibers.append(display)
 
-        manual_text = _safe_clean(manual_composition_text)
-        if manual_text:
-            return f"Composition : {manual_text.rstrip('.')}."
+    manual_text = _safe_clean(manual_composition_text)
+    if manual_text:
+        return f"Composition : {manual_text.rstrip('.')}."
 
-        clean_material = _safe_clean(material)
-        material_lower = clean_material.lower()
-        if clean_material:
-            try:
-                import re
+    clean_material = _safe_clean(material)
+    material_lower = clean_material.lower()
+    if clean_material:
+        for match in _FIBER_PERCENT_RE.finditer(clean_material):
+            _add_fiber(match.group(2), _format_percent(match.group(1)))
 
-                matches = re.findall(
-                    r"(\d+)\s*%\s*([A-Za-zÀ-ÿ]+)", clean_material, flags=re.IGNORECASE
-                )
-                for percent_txt, fiber_name in matches:
-                    percent_val = _format_percent(percent_txt)
-                    _add_fiber(fiber_name, percent_val)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning(
-                    "_build_pull_composition: parsing partiel de la composition (%s)",
-                    exc,
-                )
+    cotton_val = _format_percent(cotton_percent)
+    wool_val = _format_percent(wool_percent)
+    angora_val = _format_percent(angora_percent)
 
-        cotton_val = _format_percent(cotton_percent)
-        wool_val = _format_percent(wool_percent)
-        angora_val = _format_percent(angora_percent)
-
-        if cotton_val is not None:
-            _add_fiber("coton", cotton_val)
+    if cotton_val is not None:
+        _add_fiber("coton", cotton_val)
 
-        if angora_val is not None:
-            _add_fiber("angora", angora_val)
-        elif wool_val is not None:
-            try:
-                if "angora" in material_lower and "laine" not in material_lower:
-                    logger.info(
-                        "_build_pull_composition: wool_percent traité comme angora (material=%s)",
-                        clean_material,
-                    )
-                    _add_fiber("angora", wool_val)
-                else:
-                    _add_fiber("laine", wool_val)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.debug(
-                    "_build_pull_composition: impossible d'interpréter wool_percent (%s)",
-                    exc,
-                )
-                _add_fiber("laine", wool_val)
+    if angora_val is not None:
+        _add_fiber("angora", angora_val)
+    elif wool_val is not None:
+        if "angora" in material_lower and "laine" not in material_lower:
+            logger.info(
+                "_build_pull_composition: wool_percent traité comme angora (material=%s)",
+                clean_material,
+            )
+            _add_fiber("angora", wool_val)
+        else:
+            _add_fiber("laine", wool_val)
 
-        if fibers:
-            return "Composition : " + ", ".join(fibers) + "."
+    if fibers:
+        return f"Composition : {', '.join(fibers)}."
 
-        if clean_material:
-            return f"Composition (étiquette) : {clean_material}."
+    if clean_material:
+        return f"Composition (étiquette) : {clean_material}."
 
-        return "Composition non lisible (voir photos)."
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_build_pull_composition: erreur %s", exc)
-        return "Composition non lisible (voir photos)."
+    return "Composition non lisible (voir photos)."
 
 
+@lru_cache(maxsize=256)
 def _normalize_fit_display(raw_fit: Optional[str], model_hint: Optional[str] = None) -> str:
     """Normalise la coupe en 3 catégories : Skinny / Droit / Évasé."""
-    try:
-        if not raw_fit and not model_hint:
-            return "coupe non précisée"
+    if not raw_fit and not model_hint:
+        return "coupe non précisée"
 
-        value = (raw_fit or model_hint or "").strip()
-        low = value.lower()
-        secondary_low = (model_hint or "").strip().lower()
+    value = (raw_fit or model_hint or "").strip()
+    # Sans coupe brute, `value` est déjà l'indice modèle : inutile de le doubler
+    # (les motifs ne contiennent pas d'espace, rien ne peut chevaucher la jonction).
+    secondary = (model_hint or "").strip() if raw_fit else ""
 
-        combined = f"{low} {secondary_low}"
+    # Un seul lower() sur la chaîne combinée plutôt qu'un par morceau.
+    combined = f"{value} {secondary}".lower() if secondary else value.lower()
 
-        if "skinny" in combined or "slim" in combined:
-            return "Skinny"
+    if _SKINNY_FIT_RE.search(combined):
+        return "Skinny"
 
-        if any(m in combined for m in ("straight", "droit", "mom", "boyfriend", "girlfriend", "regular", "tapered")):
-            return "Droit"
+    if _STRAIGHT_FIT_RE.search(combined):
+        return "Droit"
 
-        if any(m in combined for m in (
-            "boot", "flare", "évas", "evase", "curve", "curvy",
-            "wide", "baggy", "loose", "relaxed", "barrel",
-        )):
-            return "Évasé"
+    if _FLARED_FIT_RE.search(combined):
+        return "Évasé"
 
-        return value or "coupe non précisée"
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("_normalize_fit_display: erreur %s", exc)
-        return "coupe non précisée"
+    return value or "coupe non précisée"
 
 
 # ---------------------------------------------------------------------------
@@ -604,32 +724,52 @@ def build_jean_levis_description(
     """
     Génère une description structurée d'un jean Levi's à partir des features
     normalisés. En cas d'erreur, on retombe sur la description IA brute.
+
+    Sans aucune feature, la description IA (si fournie) est reprise, nettoyée
+    comme pour le repli sur erreur, plutôt qu'un gabarit rempli de valeurs
+    par défaut ; la ligne de prix neuf et les défauts transmis y sont ajoutés
+    comme dans le gabarit complet.
     """
     try:
-        logger.info("build_jean_levis_description: features reçus = %s", features)
-
-        brand = _safe_clean(features.get("brand")) or "Levi's"
-        model = _safe_clean(features.get("model"))
-        raw_fit = _safe_clean(features.get("fit"))
+        if not features and ai_description:
+            logger.debug("build_jean_levis_description: features vides, description IA conservée.")
+            retail_range = get_retail_price_range(features)
+            lines = [f"💵 Prix neuf en magasin : {retail_range}", ""] if retail_range else []
+            lines.append(_strip_footer_lines(_safe_clean(ai_description)))
+            defects_clean = _normalize_defects(ai_defects)
+            if defects_clean:
+                lines.extend(("", f"👍 Très bon état : {defects_clean}"))
+            return "\n".join(lines)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("build_jean_levis_description: features reçus = %s", features)
+
+        get = features.get
+        clean = _clean_features(features, _LEVIS_TEXT_KEYS)
+        brand = clean["brand"] or "Levi's"
+        model = clean["model"]
+        raw_fit = clean["fit"]
         fit = _normalize_fit_display(raw_fit, model_hint=model)
-        color = _safe_clean(features.get("color"))
-        size_fr = _safe_clean(features.get("size_fr"))
-        size_us = _safe_clean(features.get("size_us"))
-        length = _safe_clean(features.get("length"))
-        gender = _safe_clean(features.get("gender"))
-        sku = _safe_clean(features.get("sku"))
-        order_id = _safe_clean(features.get("order_id"))
-        rise_label = _format_rise_label(features.get("rise_type"), features.get("rise_cm"))
-        defects = ai_defects or features.get("defects")
-
-        cotton_percent = _format_percent(features.get("cotton_percent"))
-        elasthane_percent = _format_percent(features.get("elasthane_percent"))
-        composition_materials = features.get("composition_materials") or []
-        composition_status = features.get("composition_status")
+        color = clean["color"]
+        size_fr = clean["size_fr"]
+        size_us = clean["size_us"]
+        length = clean["length"]
+        gender = clean["gender"]
+        sku = clean["sku"]
+        order_id = clean["order_id"]
+        rise_label = _format_rise_label(get("rise_type"), get("rise_cm"))
+        defects = ai_defects or get("defects")
+
+        cotton_percent = _format_percent(get("cotton_percent"))
+        elasthane_percent = _format_percent(get("elasthane_percent"))
+        composition_materials = get("composition_materials") or []
+
+        # Formes normalisées calculées une seule fois et réutilisées plus bas.
+        model_low = model.lower()
+        color_low = color.lower()
 
         # --- Fit effectif ---
         fit_effective = fit
-        model_low = (model or "").lower()
 
         if "demi" in model_low and "curve" in model_low:
             fit_effective = "Évasé"
@@ -637,21 +777,14 @@ def build_jean_levis_description(
             fit_effective = "Évasé"
 
         # --- Déterminer le compte Vinted selon le SKU ---
-        sku_upper = (sku or "").upper()
-        is_homme = "JLH" in sku_upper
+        is_homme = "JLH" in sku.upper()
         gender = gender or ("homme" if is_homme else "femme")
 
-        if is_homme:
-            vinted_account_tag = "#gentlemen_corner"
-            size_tag_prefix = "#GC_fr"
-        else:
-            vinted_account_tag = "#ladies_and_gentlemen"
-            size_tag_prefix = "#LG_fr"
-
+        size_tag_prefix = _LEVIS_HOMME_SIZE_TAG_PREFIX if is_homme else _LEVIS_FEMME_SIZE_TAG_PREFIX
         size_tag = f"{size_tag_prefix}{(size_fr or 'nc').lower()}"
 
         # --- Construction du libellé de coupe ---
-        fit_low = (fit_effective or "").lower()
+        fit_low = fit_effective.lower()
         if "boot" in fit_low or "évas" in fit_low or "evas" in fit_low or "flare" in fit_low:
             fit_label = "évasés"
             fit_hashtag = "évasé"
@@ -666,11 +799,10 @@ def build_jean_levis_description(
             fit_hashtag = ""
 
         # --- Libellé taille (rise) ---
-        rise_low = (rise_label or "").lower()
-        if "basse" in rise_low:
+        if "basse" in rise_label:
             rise_intro = "de taille basse"
             rise_hashtag = "lowrise"
-        elif "haute" in rise_low:
+        elif "haute" in rise_label:
             rise_intro = "de taille haute"
             rise_hashtag = "highrise"
         else:
@@ -699,23 +831,22 @@ def build_jean_levis_description(
             composition_sentence = f"Celui-ci est composé de {composition_text} disposant ainsi d'une toile de denim souple, bien tenue et confortable."
         else:
             # Fallback sur les pourcentages si pas de liste
-            composition_parts: List[str] = []
+            has_elasthane = bool(elasthane_percent) and elasthane_percent > 0
             if cotton_percent:
-                composition_parts.append("Coton")
-            if elasthane_percent and elasthane_percent > 0:
-                composition_parts.append("Élasthanne")
+                composition_text = "Coton, Élasthanne" if has_elasthane else "Coton"
+            else:
+                composition_text = "Élasthanne" if has_elasthane else ""
 
-            if composition_parts:
-                composition_text = ", ".join(composition_parts)
+            if composition_text:
                 composition_sentence = f"Celui-ci est composé de {composition_text} disposant ainsi d'une toile de denim souple, bien tenue et confortable."
             else:
-                composition_sentence = "Toile de denim souple, bien tenue et confortable."
+                composition_sentence = _LEVIS_DENIM_SENTENCE
 
         # --- Phrase couleur ---
         if color:
-            color_sentence = f"Sa couleur {color.lower()}, intemporelle, s'intègre facilement à une garde-robe."
+            color_sentence = f"Sa couleur {color_low}, intemporelle, s'intègre facilement à une garde-robe."
         else:
-            color_sentence = "Sa couleur intemporelle s'intègre facilement à une garde-robe."
+            color_sentence = _LEVIS_COLOR_FALLBACK
 
         # --- Phrase fermeture ---
         closure_sentence = f"Il est doté d'une fermeture zippée et bouton gravé {brand}."
@@ -728,29 +859,20 @@ def build_jean_levis_description(
         elif size_us:
             size_line = f"👖 Taille US {size_us}"
         else:
-            size_line = "👖 Taille : voir photos"
-
-        size_note = "*Les variations et écarts de mesure entre les tailles US et FR sont dus aux différentes proportions d'élasthanne et/ou viscose présentes dans le tissu."
+            size_line = _LEVIS_SIZE_FALLBACK
 
         # --- Bloc état ---
         defects_clean = _normalize_defects(defects)
         if not defects_clean:
-            state_line = "👍 Très bon état : article impeccable !"
+            state_line = _LEVIS_STATE_PERFECT
         else:
             state_line = f"👍 Très bon état : {defects_clean}"
 
-        # --- Bloc mesures ---
-        measures_line = "🔎 Consultez les photos pour obtenir les mesures précises et la composition détaillée."
-
-        # --- Bloc envoi ---
-        shipping_line = "📦 Envoi rapide et soigné"
-
         # --- CTA ---
-        cta_size_line = f"✨ Retrouvez tous mes articles Levi's à votre taille ici 👉 {size_tag}"
-        cta_lot_line = "💡 Jusqu'à 20% de réduction sur les lots, pensez y !"
+        cta_size_line = f"{_LEVIS_CTA_SIZE_PREFIX}{size_tag}"
 
         # --- Hashtags dynamiques ---
-        hashtag_tokens: List[str] = ["#vintage", "#levis", "#jeanlevis", "#jeandenim"]
+        hashtag_tokens: List[str] = list(_LEVIS_DESCRIPTION_BASE_TAGS)
 
         if gender.lower() == "femme":
             hashtag_tokens.append("#levisfemme")
@@ -765,7 +887,7 @@ def build_jean_levis_description(
             hashtag_tokens.append(f"#jean{fit_hashtag}")
 
         if color:
-            color_clean = color.lower().replace(" ", "")
+            color_clean = _compact_tag_token(color)
             hashtag_tokens.append(f"#jean{color_clean}")
 
         hashtag_tokens.append(size_tag)
@@ -783,21 +905,35 @@ def build_jean_levis_description(
         retail_range = get_retail_price_range(features)
         retail_line = f"💵 Prix neuf en magasin : {retail_range}" if retail_range else ""
 
-        # --- Assemblage final ---
+        # --- Assemblage final (une seule jointure, "" = ligne vide entre blocs) ---
         paragraph1 = f"{intro_sentence} {composition_sentence} {color_sentence} {closure_sentence}"
-        info_block = "\n".join([size_line, size_note, state_line, measures_line])
-        footer_block = "\n".join([shipping_line, "", cta_size_line, cta_lot_line, "", hashtags])
+        lines: List[str] = [retail_line, ""] if retail_line else []
+        lines.extend(
+            (
+                paragraph1,
+                "",
+                size_line,
+                _LEVIS_SIZE_NOTE,
+                state_line,
+                _LEVIS_MEASURES_LINE,
+                "",
+                _LEVIS_SHIPPING_LINE,
+                "",
+                cta_size_line,
+                _LEVIS_CTA_LOT_LINE,
+                "",
+                hashtags,
+            )
+        )
 
-        if retail_line:
-            description = f"{retail_line}\n\n{paragraph1}\n\n{info_block}\n\n{footer_block}"
-        else:
-            description = f"{paragraph1}\n\n{info_block}\n\n{footer_block}"
-        logger.debug("build_jean_levis_description: description générée = %s", description)
+        description = "\n".join(lines)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("build_jean_levis_description: description générée = %s", description)
         return description
 
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception("build_jean_levis_description: fallback description IA (%s)", exc)
-        return _safe_clean(ai_description)
+        return _strip_footer_lines(_safe_clean(ai_description))
 
 
 def build_pull_description(
@@ -813,47 +949,39 @@ def build_pull_description(
       - Pulls vintage/unbranded (is_vintage=True ou brand=None)
     """
     try:
-        logger.info("build_pull_description: features recus = %s", features)
-
-        brand = _safe_clean(features.get("brand"))
-        is_vintage = features.get("is_vintage", False)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("build_pull_description: features recus = %s", features)
 
+        get = features.get
+        clean = _clean_features(features, _PULL_TEXT_KEYS)
         # Si pas de marque, c'est un pull vintage
-        if not brand:
-            is_vintage = True
-            brand = "Vintage"
-
-        garment_type = _safe_clean(features.get("garment_type")) or "pull"
-        gender = _safe_clean(features.get("gender")) or "femme"
-        neckline = _safe_clean(features.get("neckline"))
-        pattern = _safe_clean(features.get("pattern"))
-        material = _safe_clean(features.get("material"))
-        cotton_percent = features.get("cotton_percent")
-        wool_percent = features.get("wool_percent")
-        angora_percent = features.get("angora_percent")
-        colors_raw = features.get("main_colors")
-        size = _normalize_pull_size(features.get("size"))
-        size_source = (_safe_clean(features.get("size_source")) or "").lower()
-        measurement_mode = (_safe_clean(features.get("measurement_mode")) or "").lower()
-        defects = ai_defects or features.get("defects")
-        sku = _safe_clean(features.get("sku"))
-        order_id = _safe_clean(features.get("order_id"))
+        brand = clean["brand"] or "Vintage"
+
+        garment_type = clean["garment_type"] or "pull"
+        gender = clean["gender"] or "femme"
+        neckline = clean["neckline"]
+        pattern = clean["pattern"]
+        material = clean["material"]
+        cotton_percent = get("cotton_percent")
+        wool_percent = get("wool_percent")
+        angora_percent = get("angora_percent")
+        manual_composition_text = get("manual_composition_text")
+        colors_raw = get("main_colors")
+        size = _normalize_pull_size(get("size"))
+        size_source = clean["size_source"].lower()
+        measurement_mode = clean["measurement_mode"].lower()
+        defects = ai_defects or get("defects")
+        sku = clean["sku"]
+        order_id = clean["order_id"]
 
         colors = ""
-        try:
-            if isinstance(colors_raw, list):
-                colors = ", ".join([_safe_clean(c) for c in colors_raw if _safe_clean(c)])
-            else:
-                colors = _safe_clean(colors_raw)
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("build_pull_description: couleurs non exploitables (%s)", exc)
-            colors = ""
+        if isinstance(colors_raw, list):
+            colors = ", ".join(filter(None, map(_safe_clean, colors_raw)))
+        else:
+            colors = _safe_clean(colors_raw)
 
-        intro_parts: List[str] = []
-        intro_parts.append(f"{garment_type.capitalize()} {brand}")
-        if gender:
-            intro_parts.append(f"pour {gender}")
-        intro_base = " ".join(intro_parts).strip()
+        # garment_type, brand et gender ont toujours une valeur (défauts ci-dessus)
+        intro_base = f"{garment_type.capitalize()} {brand} pour {gender}"
 
         if size:
             if size_source == "estimated" or measurement_mode == "mesures":
@@ -887,115 +1015,84 @@ def build_pull_description(
             neckline_text = "Maille"
 
         style_clause = f" dans un style {pattern}" if pattern else ""
-        try:
-            comfort_phrases = {
-                "angora": "pour une douceur légère et élégante",
-                "laine": "pour une chaleur douce et confortable",
-                "coton": "pour un confort respirant au quotidien",
-            }
-            material_key = ""
-            for key in comfort_phrases:
-                if key in material_phrase.lower():
-                    material_key = key
-                    break
-            comfort_clause = comfort_phrases.get(material_key, "pour un look iconique et confortable")
-            descriptive_sentence = (
-                f"{neckline_text}{style_clause} aux coloris {color_text}, et une {material_phrase} {comfort_clause}."
-            ).strip()
-            if descriptive_sentence and not descriptive_sentence[0].isupper():
-                descriptive_sentence = descriptive_sentence[0].upper() + descriptive_sentence[1:]
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("build_pull_description: phrase descriptive par défaut (%s)", exc)
-            descriptive_sentence = (
-                f"{neckline_text}{style_clause} aux coloris {color_text}, et une {material_phrase} pour un look iconique et confortable."
-            ).strip()
+        material_phrase_low = material_phrase.lower()
+        comfort_clause = next(
+            (
+                phrase
+                for key, phrase in _PULL_COMFORT_PHRASES.items()
+                if key in material_phrase_low
+            ),
+            _PULL_DEFAULT_COMFORT,
+        )
+        descriptive_sentence = (
+            f"{neckline_text}{style_clause} aux coloris {color_text}, et une {material_phrase} {comfort_clause}."
+        ).strip()
+        if descriptive_sentence and not descriptive_sentence[0].isupper():
+            descriptive_sentence = descriptive_sentence[0].upper() + descriptive_sentence[1:]
 
         composition_sentence = _build_pull_composition(
             material=material,
             cotton_percent=cotton_percent,
             wool_percent=wool_percent,
             angora_percent=angora_percent,
-            manual_composition_text=features.get("manual_composition_text"),
+            manual_composition_text=manual_composition_text,
         )
 
         state_sentence = _build_state_sentence(defects)
 
-        logistics_lines = [
-            "📏 Mesures détaillées visibles en photo pour plus de précisions.",
-            "📦 Envoi rapide et soigné.",
-        ]
-        logistics_sentence = "\n".join(logistics_lines)
+        # Dict utilisé comme ensemble ordonné : dédoublonnage O(1), ordre d'insertion conservé
+        tokens_hashtag: Dict[str, None] = {}
+        size_token = _normalize_pull_size(size).replace(" ", "") if size else "NC"
+        durin_tag = f"#durin31tf{size_token}"
 
-        tokens_hashtag: List[str] = []
-        try:
-            size_token = _normalize_pull_size(size).replace(" ", "") if size else "NC"
-            durin_tag = f"#durin31tf{size_token}"
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("build_pull_description: durin_tag défaut (%s)", exc)
-            size_token = "NC"
-            durin_tag = "#durin31tfNC"
+        _add_tag = tokens_hashtag.setdefault
 
-        try:
-            def _add_tag(token: str) -> None:
-                if token and token not in tokens_hashtag:
-                    tokens_hashtag.append(token)
-
-            base_tags = [
-                "#tommyhilfiger",
-                "#pulltommy",
-                "#tommy",
-                "#pullfemme",
-                "#modefemme",
-                "#preloved",
-                durin_tag,
-                "#ptf",
-            ]
-            for token in base_tags:
-                _add_tag(token)
-
-            if cotton_val is not None:
-                _add_tag("#pullcoton")
-            if pattern and pattern.lower().strip() == "torsade":
-                _add_tag("#pulltorsade")
-
-            if colors:
-                for color_token in colors.split(","):
-                    clean_color = color_token.strip().lower().replace(" ", "")
-                    if clean_color:
-                        _add_tag(f"#{clean_color}")
-
-            # Hashtag SKU + Order ID (format: #durin31ptf123_20)
-            if sku:
-                sku_clean = sku.lower().replace(" ", "")
-                if order_id:
-                    _add_tag(f"#durin31{sku_clean}_{order_id}")
-                else:
-                    _add_tag(f"#durin31{sku_clean}")
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("build_pull_description: hashtags réduits (%s)", exc)
+        tokens_hashtag.update(dict.fromkeys(_TOMMY_BASE_TAGS))
+        _add_tag(durin_tag)
+        _add_tag("#ptf")
+
+        if cotton_val is not None:
+            _add_tag("#pullcoton")
+        if pattern and pattern.lower().strip() == "torsade":
+            _add_tag("#pulltorsade")
+
+        if colors:
+            for color_token in colors.split(","):
+                clean_color = color_token.strip().lower().replace(" ", "")
+                if clean_color:
+                    _add_tag(f"#{clean_color}")
+
+        # Hashtag SKU + Order ID (format: #durin31ptf123_20)
+        if sku:
+            sku_clean = sku.lower().replace(" ", "")
+            if order_id:
+                _add_tag(f"#durin31{sku_clean}_{order_id}")
+            else:
+                _add_tag(f"#durin31{sku_clean}")
 
         hashtags_block = " ".join(tokens_hashtag)
         hashtags_with_cta = "\n".join(
-            [
+            (
                 f"✨ Retrouvez tous mes pulls Tommy femme ici 👉 {durin_tag}",
-                "💡 Pensez à faire un lot pour profiter d’une réduction supplémentaire et économiser des frais d’envoi !",
+                _PULL_CTA_LOT_LINE,
                 "",
                 hashtags_block,
-            ]
+            )
         )
 
-        paragraphs = [
+        paragraphs = (
             intro_sentence,
             descriptive_sentence,
             composition_sentence,
             state_sentence,
-            logistics_sentence,
+            _PULL_LOGISTICS_SENTENCE,
             hashtags_with_cta,
-        ]
+        )
 
-        description = "\n\n".join([p for p in paragraphs if p])
+        description = "\n\n".join(filter(None, paragraphs))
         cleaned = _strip_footer_lines(description)
-        logger.debug("build_pull_description: description generee = %s", cleaned)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("build_pull_description: description generee = %s", cleaned)
         return cleaned
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception("build_pull_description: fallback description IA (%s)", exc)
@@ -1006,28 +1103,6 @@ def build_pull_description(
 build_pull_tommy_description = build_pull_description
 
 
-def _describe_lining(lining: str) -> str:
-    try:
-        lining_clean = _clean_carhartt_material_segment(lining)
-        if not lining_clean:
-            return ""
-        return f"Intérieur : {lining_clean}"
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("_describe_lining: description de doublure impossible (%s)", exc)
-        return ""
-
-
-def _describe_patch_material(patch_material: str) -> str:
-    try:
-        material_clean = patch_material.strip()
-        if not material_clean:
-            return ""
-        return f"Écusson {material_clean}."
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("_describe_patch_material: description écusson impossible (%s)", exc)
-        return ""
-
-
 def _strip_percentage_tokens(text: str) -> str:
     """Supprime les pourcentages pour construire un texte descriptif (sans composition).
 
@@ -1035,17 +1110,38 @@ def _strip_percentage_tokens(text: str) -> str:
     composition détaillée (avec pourcentages) est présentée dans un bloc dédié.
     """
 
-    try:
-        if not text:
-            return ""
+    if not text:
+        return ""
 
-        no_parentheses = re.sub(r"\((?:[^)(]+|\([^)(]*\))*\)", "", text)
-        no_percent = re.sub(r"\b\d+\s*%\s*", "", no_parentheses)
-        normalized_spaces = re.sub(r"\s{2,}", " ", no_percent)
-        return normalized_spaces.strip()
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.warning("_strip_percentage_tokens: nettoyage impossible (%s)", exc)
-        return text or ""
+    no_parentheses = _PARENTHESES_RE.sub("", text)
+    no_percent = _PERCENT_TOKEN_RE.sub("", no_parentheses)
+    normalized_spaces = _MULTI_SPACE_RE.sub(" ", no_percent)
+    return normalized_spaces.strip()
+
+
+@lru_cache(maxsize=256)
+def _detect_collar(collar: str) -> tuple[str, str]:
+    """Retourne (type, matière) du col à partir du texte nettoyé (mise en cache)."""
+    collar_low = collar.lower()
+    collar_type = next((label for key, label in _COLLAR_TYPES if key in collar_low), "")
+    collar_material = (
+        "velours côtelé" if any(key in collar_low for key in _COLLAR_CORDUROY_KEYS) else ""
+    )
+    return collar_type, collar_material
+
+
+def _pick_percent_line(text: str, separator: str = ", ") -> str:
+    """
+    Récupère une composition courte du type '100 % coton' si présente,
+    sinon renvoie un nettoyage minimal.
+    """
+    cleaned = _clean_carhartt_material_segment(text)
+    if not cleaned:
+        return ""
+    matches = _PERCENT_LINE_RE.findall(cleaned)
+    if matches:
+        return separator.join(m.strip() for m in matches)
+    return cleaned
 
 
 def build_jacket_carhart_description(
@@ -1053,251 +1149,212 @@ def build_jacket_carhart_description(
     ai_description: Optional[str] = None,
     ai_defects: Optional[str] = None,
 ) -> str:
-    """Produit une description détaillée pour une veste Carhartt."""
+    """
+    Produit une description détaillée pour une veste Carhartt.
+    En cas d'erreur, on retombe sur la description IA nettoyée.
+    """
     try:
-        logger.info("build_jacket_carhart_description: features reçus = %s", features)
-
-        brand = _safe_clean(features.get("brand")) or "Carhartt"
-        brand = brand.capitalize()
-        model = _safe_clean(features.get("model"))
-
-        raw_size = _safe_clean(features.get("size")) or "NC"
-        size_short, size_display, size_token = _normalize_carhartt_size(raw_size)
-
-        color = _safe_clean(features.get("color"))
-        gender = _safe_clean(features.get("gender")) or "homme"
-
-        lining = _safe_clean(features.get("lining"))
-        patch_material = _safe_clean(features.get("patch_material"))
-        collar = _safe_clean(features.get("collar"))
-        zip_material = _safe_clean(features.get("zip_material"))
-        origin_country = _safe_clean(features.get("origin_country"))
-        sku = _safe_clean(features.get("sku"))
-        order_id = _safe_clean(features.get("order_id"))
-
-        # --- 1) Phrase produit -------------------------------------------------
-        product_sentence_parts: List[str] = [f"Veste {brand}"]
-        if model:
-            product_sentence_parts.append(model)
-        if gender:
-            product_sentence_parts.append(f"pour {gender}")
-        product_sentence_parts.append(f"taille {size_display}")
-        if color:
-            product_sentence_parts.append(f"coloris {color}")
-        if origin_country:
-            product_sentence_parts.append(f"Made in {origin_country}")
-
-        product_sentence = (
-            " ".join(token for token in product_sentence_parts if token).strip().rstrip(".")
-            + "."
-        )
+        return _build_jacket_carhart_description(features, ai_defects)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception("build_jacket_carhart_description: fallback description IA (%s)", exc)
+        return _strip_footer_lines(_safe_clean(ai_description))
 
-        # --- 2) Phrase style ---------------------------------------------------
-        patch_label = (patch_material or "simili-cuir").lower()
-        color_intro = (
-            f"Le coloris {color.lower()} sobre s’associe facilement avec toutes les tenues."
-            if color
-            else "Coloris à confirmer sur les photos."
-        )
-        style_sentence = (
-            "Modèle iconique du workwear Carhartt, coupe droite intemporelle, "
-            f"écusson Carhartt en {patch_label}, facile à porter au quotidien. "
-            f"{color_intro}"
-        )
 
-        # --- 3) Champs utiles à la composition -------------------------------
-        exterior_raw = _safe_clean(features.get("exterior"))
-        sleeve_lining_clean = _clean_carhartt_material_segment(
-            _safe_clean(features.get("sleeve_lining"))
+def _build_jacket_carhart_description(
+    features: Dict[str, Any], ai_defects: Optional[str] = None
+) -> str:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("build_jacket_carhart_description: features reçus = %s", features)
+
+    clean = _clean_features(features, _CARHARTT_TEXT_KEYS)
+    # Le défaut est déjà capitalisé : capitalize() seulement sur une saisie.
+    brand = clean["brand"]
+    brand = brand.capitalize() if brand else "Carhartt"
+    model = clean["model"]
+
+    raw_size = clean["size"] or "NC"
+    _size_short, size_display, size_token = _normalize_carhartt_size(raw_size)
+
+    color = clean["color"]
+    color_low = color.lower()
+    gender = clean["gender"] or "homme"
+
+    lining = clean["lining"]
+    # Minuscules calculées une fois : servent au libellé et à la composition.
+    lining_low = lining.lower()
+    patch_material = clean["patch_material"]
+    collar = clean["collar"]
+    zip_material = clean["zip_material"]
+    origin_country = clean["origin_country"]
+    sku = clean["sku"]
+    order_id = clean["order_id"]
+
+    # --- 1) Phrase produit -------------------------------------------------
+    product_sentence_parts: List[str] = [f"Veste {brand}"]
+    if model:
+        product_sentence_parts.append(model)
+    if gender:
+        product_sentence_parts.append(f"pour {gender}")
+    product_sentence_parts.append(f"taille {size_display}")
+    if color:
+        product_sentence_parts.append(f"coloris {color}")
+    if origin_country:
+        product_sentence_parts.append(f"Made in {origin_country}")
+
+    # Chaque fragment est non vide et déjà nettoyé : seul un point final
+    # venant de la saisie (modèle, coloris, pays) reste à retirer.
+    product_sentence = " ".join(product_sentence_parts).rstrip(".") + "."
+
+    # --- 2) Phrase style ---------------------------------------------------
+    patch_label = (patch_material or "simili-cuir").lower()
+    color_intro = (
+        f"Le coloris {color_low} sobre s’associe facilement avec toutes les tenues."
+        if color
+        else "Coloris à confirmer sur les photos."
+    )
+    style_sentence = (
+        "Modèle iconique du workwear Carhartt, coupe droite intemporelle, "
+        f"écusson Carhartt en {patch_label}, facile à porter au quotidien. "
+        f"{color_intro}"
+    )
+
+    # --- 3) Champs utiles à la composition -------------------------------
+    exterior_raw = clean["exterior"]
+    sleeve_lining_clean = _clean_carhartt_material_segment(clean["sleeve_lining"])
+
+    # --- 4) Col : extraction type + matière -------------------------------
+    collar_type, collar_material = _detect_collar(collar)
+    logger.debug(
+        "build_jacket_carhart_description: col détecté type=%s matière=%s (raw=%s)",
+        collar_type,
+        collar_material,
+        collar,
+    )
+
+    # --- 6) Paragraphe doublure / col (court) -----------------------------
+    lining_label = ""
+    if "matelass" in lining_low:
+        lining_label = "doublure matelassée"
+    elif "sherpa" in lining_low:
+        lining_label = "doublure sherpa"
+    elif lining:
+        lining_label = _strip_percentage_tokens(_clean_carhartt_material_segment(lining))
+
+    warmth_parts: List[str] = []
+    if lining_label:
+        warmth_parts.append(
+            f"La {lining_label} apporte une bonne chaleur, idéale pour la mi-saison comme pour l’hiver"
         )
 
-        # --- 4) Col : extraction type + matière -------------------------------
-        collar_type = ""
-        collar_material = ""
-        try:
-            collar_raw = (collar or "").strip()
-            collar_low = collar_raw.lower()
-
-            if "chemise" in collar_low:
-                collar_type = "chemise"
-            elif "montant" in collar_low:
-                collar_type = "montant"
-            elif "teddy" in collar_low:
-                collar_type = "teddy"
-            elif "officier" in collar_low:
-                collar_type = "officier"
-
-            if any(k in collar_low for k in ("velours", "côtel", "cotele", "corduroy")):
-                collar_material = "velours côtelé"
-
-            logger.debug(
-                "build_jacket_carhart_description: col détecté type=%s matière=%s (raw=%s)",
-                collar_type,
-                collar_material,
-                collar_raw,
-            )
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("build_jacket_carhart_description: parsing col échoué (%s)", exc)
-            collar_type = ""
-            collar_material = ""
-
-        # --- 5) Helpers composition ------------------------------------------
-        def _pick_percent_line(text: str) -> str:
-            """
-            Récupère une composition courte du type '100 % coton' si présente,
-            sinon renvoie un nettoyage minimal.
-            """
-            try:
-                cleaned = _clean_carhartt_material_segment(text)
-                if not cleaned:
-                    return ""
-                matches = re.findall(r"\d+\s*%\s*[A-Za-zÀ-ÿ'’\- ]+", cleaned)
-                if matches:
-                    return ", ".join(m.strip() for m in matches)
-                return cleaned
-            except Exception as exc:  # pragma: no cover
-                logger.warning("_pick_percent_line: erreur (%s)", exc)
-                return _clean_carhartt_material_segment(text) or ""
-
-        # --- 6) Paragraphe doublure / col (court) -----------------------------
-        lining_label = ""
-        try:
-            low = (lining or "").lower()
-            if "matelass" in low:
-                lining_label = "doublure matelassée"
-            elif "sherpa" in low:
-                lining_label = "doublure sherpa"
-            elif lining:
-                lining_label = _strip_percentage_tokens(_clean_carhartt_material_segment(lining))
-        except Exception as exc:  # pragma: no cover
-            logger.debug("lining_label: fallback (%s)", exc)
-
-        warmth_parts: List[str] = []
-        if lining_label:
-            warmth_parts.append(
-                f"La {lining_label} apporte une bonne chaleur, idéale pour la mi-saison comme pour l’hiver"
-            )
-
-        # Col (priorité à la matière si détectée)
-        if collar_material:
-            if collar_type == "chemise":
-                warmth_parts.append(f"avec un col chemise en {collar_material}")
-            elif collar_type:
-                warmth_parts.append(f"avec un col {collar_type} en {collar_material}")
-            else:
-                warmth_parts.append(f"avec un col en {collar_material}")
+    # Col (priorité à la matière si détectée)
+    if collar_material:
+        if collar_type == "chemise":
+            warmth_parts.append(f"avec un col chemise en {collar_material}")
         elif collar_type:
-            warmth_parts.append(f"avec un col {collar_type}")
-
-        warmth_sentence = ""
-        if warmth_parts:
-            warmth_sentence = ", ".join(warmth_parts).strip().rstrip(".") + "."
-
-        # --- 7) Paragraphe zip (court) ---------------------------------------
-        zip_sentence = ""
-        if zip_material:
-            zip_sentence = f"Fermeture zippée intégrale en {zip_material}."
-
-        # --- 8) Composition (lignes courtes) ---------------------------------
-        composition_lines: List[str] = []
-
-        ext_line = _pick_percent_line(exterior_raw or "")
-        if ext_line:
-            composition_lines.append(f"Extérieur : {ext_line}")
-
-        lining_line = _pick_percent_line(lining or "")
-        if lining_line:
-            if "matelass" in (lining or "").lower() and ("(" in (lining or "") or "," in (lining or "")):
-                composition_lines.append(f"Doublure : matelassée ({lining_line})")
-            else:
-                composition_lines.append(f"Doublure : {lining_line}")
-
-        sleeve_line = _pick_percent_line(sleeve_lining_clean or "")
-        if sleeve_line:
-            composition_lines.append(f"Doublure des manches : {sleeve_line}")
-
-        if collar_material:
-            composition_lines.append(f"Col : {collar_material}")
-        elif collar_type:
-            composition_lines.append(f"Col : {collar_type}")
-
-        composition_block = ""
-        if composition_lines:
-            composition_block = "Composition :\n" + "\n".join(composition_lines)
-
-        # --- 9) État ----------------------------------------------------------
-        defects = _safe_clean(features.get("defects") or ai_defects)
-        normalized_defects = _normalize_defects(defects)
-        if not normalized_defects:
-            state_sentence = "Très bon état, aucun défaut majeur visible. Veste propre et bien conservée (voir photos)."
+            warmth_parts.append(f"avec un col {collar_type} en {collar_material}")
         else:
-            nd = normalized_defects.strip()
-            # si ça commence par une majuscule, on la baisse (après virgule)
-            if nd[:1].isupper():
-                nd = nd[:1].lower() + nd[1:]
-            state_sentence = f"Très bon état, {nd}. Veste propre et bien conservée (voir photos)."
-
-        # --- 10) Footer / tags ----------------------------------------------
-        general_tag = "#durin31jc"
-        size_tag = f"{general_tag}{size_token}" if size_token else "#durin31jcnc"
-        color_tag = f"#{color.lower().replace(' ', '')}" if color else ""
-
-        # Hashtag SKU + Order ID (format: #durin31jcr123_20)
-        sku_order_tag = ""
-        if sku:
-            sku_clean = sku.lower().replace(" ", "")
-            if order_id:
-                sku_order_tag = f"#durin31{sku_clean}_{order_id}"
-            else:
-                sku_order_tag = f"#durin31{sku_clean}"
+            warmth_parts.append(f"avec un col en {collar_material}")
+    elif collar_type:
+        warmth_parts.append(f"avec un col {collar_type}")
+
+    warmth_sentence = ""
+    if warmth_parts:
+        warmth_sentence = f"{', '.join(warmth_parts).strip().rstrip('.')}."
+
+    # --- 7) Paragraphe zip (court) ---------------------------------------
+    zip_sentence = ""
+    if zip_material:
+        zip_sentence = f"Fermeture zippée intégrale en {zip_material}."
+
+    # --- 8) Composition (lignes courtes) ---------------------------------
+    composition_lines: List[str] = []
+
+    ext_line = _pick_percent_line(exterior_raw or "")
+    if ext_line:
+        composition_lines.append(f"Extérieur : {ext_line}")
+
+    lining_line = _pick_percent_line(lining or "")
+    if lining_line:
+        if "matelass" in lining_low and ("(" in lining or "," in lining):
+            composition_lines.append(f"Doublure : matelassée ({lining_line})")
+        else:
+            composition_lines.append(f"Doublure : {lining_line}")
+
+    sleeve_line = _pick_percent_line(sleeve_lining_clean or "")
+    if sleeve_line:
+        composition_lines.append(f"Doublure des manches : {sleeve_line}")
+
+    if collar_material:
+        composition_lines.append(f"Col : {collar_material}")
+    elif collar_type:
+        composition_lines.append(f"Col : {collar_type}")
+
+    composition_block = ""
+    if composition_lines:
+        composition_block = "\n".join(("Composition :", *composition_lines))
+
+    # --- 9) État ----------------------------------------------------------
+    defects = _safe_clean(features.get("defects") or ai_defects)
+    normalized_defects = _normalize_defects(defects)
+    if not normalized_defects:
+        state_sentence = _CARHARTT_STATE_PERFECT
+    else:
+        nd = normalized_defects.strip()
+        # si ça commence par une majuscule, on la baisse (après virgule)
+        if nd[:1].isupper():
+            nd = nd[:1].lower() + nd[1:]
+        state_sentence = f"Très bon état, {nd}. Veste propre et bien conservée (voir photos)."
+
+    # --- 10) Footer / tags ----------------------------------------------
+    general_tag = _CARHARTT_GENERAL_TAG
+    size_tag = f"{general_tag}{size_token}" if size_token else "#durin31jcnc"
+    color_tag = f"#{color_low.replace(' ', '')}" if color else ""
+
+    # Hashtag SKU + Order ID (format: #durin31jcr123_20)
+    sku_order_tag = ""
+    if sku:
+        sku_clean = sku.lower().replace(" ", "")
+        if order_id:
+            sku_order_tag = f"#durin31{sku_clean}_{order_id}"
+        else:
+            sku_order_tag = f"#durin31{sku_clean}"
 
-        logistics_sentence = "📏 Mesures détaillées visibles en photo pour plus de précisions."
-        shipping_sentence = "📦 Envoi rapide et soigné."
-        cta_sentence = (
-            f"✨ Retrouvez toutes mes vestes Carhartt ici 👉 {general_tag} et à votre taille 👉 {size_tag}"
-        )
-        bundle_sentence = (
-            "💡 Pensez à faire un lot pour bénéficier d'une réduction et économiser sur les frais d'envoi."
-        )
+    cta_sentence = (
+        f"✨ Retrouvez toutes mes vestes Carhartt ici 👉 {general_tag} et à votre taille 👉 {size_tag}"
+    )
 
-        hashtags = " ".join(
-            token
-            for token in [
-                "#carhartt",
-                "#jacket",
-                "#workwear",
-                "#vintage",
-                "#detroitjacket",
-                "#detroit",
+    hashtags = " ".join(
+        filter(
+            None,
+            (
+                *_CARHARTT_BASE_TAGS,
                 f"#madein{origin_country.lower()}" if origin_country else "",
                 general_tag,
                 "#durin31",
                 size_tag,
                 color_tag,
                 sku_order_tag,
-            ]
-            if token
-        ).strip()
-
-        # --- 11) Assemblage final -------------------------------------------
-        paragraphs = [
-            product_sentence,
-            style_sentence,
-            warmth_sentence,
-            zip_sentence,
-            composition_block,
-            state_sentence,
-            logistics_sentence,
-            shipping_sentence,
-            cta_sentence,
-            bundle_sentence,
-            hashtags,
-        ]
-
-        description = "\n\n".join(part for part in paragraphs if part).strip()
-        logger.debug("build_jacket_carhart_description: description générée = %s", description)
-        return description
-
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.exception("build_jacket_carhart_description: fallback description IA (%s)", exc)
-        return _strip_footer_lines(_safe_clean(ai_description))
+            ),
+        )
+    )
+
+    # --- 11) Assemblage final -------------------------------------------
+    paragraphs = (
+        product_sentence,
+        style_sentence,
+        warmth_sentence,
+        zip_sentence,
+        composition_block,
+        state_sentence,
+        _CARHARTT_LOGISTICS_SENTENCE,
+        _CARHARTT_SHIPPING_SENTENCE,
+        cta_sentence,
+        _CARHARTT_BUNDLE_SENTENCE,
+        hashtags,
+    )
+
+    # Le premier et le dernier paragraphe sont toujours présents et sans
+    # blancs en bordure : un seul join suffit, sans strip final.
+    description = "\n\n".join(filter(None, paragraphs))
+    logger.debug("build_jacket_carhart_description: description générée = %s", description)
+    return description
@@ -3,20 +3,25 @@
 from __future__ import annotations
 
 import logging
-import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence
 
 from domain.description_builder import (
+    _CARHARTT_TEXT_KEYS,
     _build_composition,
     _build_hashtags,
     _build_state_sentence,
     _clean_carhartt_material_segment,
+    _clean_features,
+    _detect_collar,
     _format_percent,
     _format_rise_label,
     _normalize_carhartt_size,
     _normalize_defects,
     _normalize_fit_display,
     _normalize_pull_size,
+    _pick_percent_line,
     _safe_clean,
     _strip_footer_lines,
     _strip_percentage_tokens,
@@ -37,6 +42,7 @@ def build_description_jean_levis(
         raw_fit = _safe_clean(features.get("fit"))
         fit = _normalize_fit_display(raw_fit, model_hint=model)
         color = _safe_clean(features.get("color"))
+        color_low = color.lower()
         size_fr = _safe_clean(features.get("size_fr"))
         size_us = _safe_clean(features.get("size_us"))
         length = _safe_clean(features.get("length"))
@@ -141,7 +147,7 @@ def build_description_jean_levis(
 
         # --- Phrase couleur ---
         if color:
-            color_sentence = f"Sa couleur {color.lower()}, intemporelle, s'intègre facilement à une garde-robe."
+            color_sentence = f"Sa couleur {color_low}, intemporelle, s'intègre facilement à une garde-robe."
         else:
             color_sentence = "Sa couleur intemporelle s'intègre facilement à une garde-robe."
 
@@ -197,7 +203,7 @@ def build_description_jean_levis(
 
         # Couleur
         if color:
-            color_clean = color.lower().replace(" ", "")
+            color_clean = color_low.replace(" ", "")
             hashtag_tokens.append(f"#jean{color_clean}")
 
         # Tag taille
@@ -263,6 +269,7 @@ def build_description_pull(
 
         garment_type = _safe_clean(features.get("garment_type")) or "pull"
         gender = _safe_clean(features.get("gender")) or "femme"
+        gender_low = gender.lower()
         neckline = _safe_clean(features.get("neckline"))
         pattern = _safe_clean(features.get("pattern"))
         material = _safe_clean(features.get("material"))
@@ -295,7 +302,7 @@ def build_description_pull(
         # Ex: "Pull Tommy Hilfiger femme - taille XL. Maille torsadée, col V, bleu. 100% coton."
         headline_main: List[str] = [f"{garment_type.capitalize()} {brand}"]
         if gender:
-            headline_main.append(gender.lower())
+            headline_main.append(gender_low)
 
         cotton_val = _format_percent(cotton_percent)
         wool_val = _format_percent(wool_percent)
@@ -341,10 +348,8 @@ def build_description_pull(
         headline = "\n".join([line for line in [headline_line1, headline_line2] if line])
 
         # --- Composition (priorité au % si dispo, sinon à l'étiquette texte) ---
+        # cotton_val / wool_val / angora_val déjà calculés pour la sensation
         composition_sentence = None
-        cotton_val = _format_percent(cotton_percent)
-        wool_val = _format_percent(wool_percent)
-        angora_val = _format_percent(angora_percent)
 
         comp_tokens = []
         if cotton_val is not None:
@@ -396,7 +401,7 @@ def build_description_pull(
         _add_tag("#tommyhilfiger")
         _add_tag("#pulltommy")
         _add_tag("#tommy")
-        _add_tag("#pullfemme" if gender.lower() == "femme" else "#pullhomme")
+        _add_tag("#pullfemme" if gender_low == "femme" else "#pullhomme")
         _add_tag("#mode")
         _add_tag("#preloved")
         _add_tag(durin_tag)
@@ -448,23 +453,29 @@ def build_description_jacket_carhart(
     features: Dict[str, Any], ai_description: Optional[str] = None, ai_defects: Optional[str] = None
 ) -> str:
     try:
-        logger.info("build_description_jacket_carhart: features reçus = %s", features)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("build_description_jacket_carhart: features reçus = %s", features)
 
-        brand = _safe_clean(features.get("brand")) or "Carhartt"
-        brand = brand.capitalize()
-        model = _safe_clean(features.get("model"))
+        clean = _clean_features(features, _CARHARTT_TEXT_KEYS)
+        # Le défaut est déjà capitalisé : capitalize() seulement sur une saisie.
+        brand = clean["brand"]
+        brand = brand.capitalize() if brand else "Carhartt"
+        model = clean["model"]
 
-        raw_size = _safe_clean(features.get("size")) or "NC"
+        raw_size = clean["size"] or "NC"
         size_short, size_display, size_token = _normalize_carhartt_size(raw_size)
 
-        color = _safe_clean(features.get("color"))
-        gender = _safe_clean(features.get("gender")) or "homme"
+        color = clean["color"]
+        color_low = color.lower()
+        gender = clean["gender"] or "homme"
 
-        lining = _safe_clean(features.get("lining"))
-        patch_material = _safe_clean(features.get("patch_material"))
-        collar = _safe_clean(features.get("collar"))
-        zip_material = _safe_clean(features.get("zip_material"))
-        origin_country = _safe_clean(features.get("origin_country"))
+        lining = clean["lining"]
+        # Minuscules calculées une fois : servent au libellé et à la composition.
+        lining_low = lining.lower()
+        patch_material = clean["patch_material"]
+        collar = clean["collar"]
+        zip_material = clean["zip_material"]
+        origin_country = clean["origin_country"]
 
         product_sentence_parts: List[str] = [f"Veste {brand}"]
         if model:
@@ -477,14 +488,13 @@ def build_description_jacket_carhart(
         if origin_country:
             product_sentence_parts.append(f"Made in {origin_country}")
 
-        product_sentence = (
-            " ".join(token for token in product_sentence_parts if token).strip().rstrip(".")
-            + "."
-        )
+        # Chaque fragment est non vide et déjà nettoyé : seul un point final
+        # venant de la saisie (modèle, coloris, pays) reste à retirer.
+        product_sentence = " ".join(product_sentence_parts).rstrip(".") + "."
 
         patch_label = (patch_material or "simili-cuir").lower()
         color_intro = (
-            f"Le coloris {color.lower()} sobre s’associe facilement avec toutes les tenues."
+            f"Le coloris {color_low} sobre s’associe facilement avec toutes les tenues."
             if color
             else "Coloris à confirmer sur les photos."
         )
@@ -494,62 +504,26 @@ def build_description_jacket_carhart(
             f"{color_intro}"
         )
 
-        exterior_raw = _safe_clean(features.get("exterior"))
-        sleeve_lining_clean = _clean_carhartt_material_segment(_safe_clean(features.get("sleeve_lining")))
+        exterior_raw = clean["exterior"]
+        sleeve_lining_clean = _clean_carhartt_material_segment(clean["sleeve_lining"])
 
-        collar_type = ""
-        collar_material = ""
-        try:
-            collar_raw = (collar or "").strip()
-            collar_low = collar_raw.lower()
-
-            if "chemise" in collar_low:
-                collar_type = "chemise"
-            elif "montant" in collar_low:
-                collar_type = "montant"
-            elif "teddy" in collar_low:
-                collar_type = "teddy"
-            elif "officier" in collar_low:
-                collar_type = "officier"
-
-            if any(k in collar_low for k in ("velours", "côtel", "cotele", "corduroy")):
-                collar_material = "velours côtelé"
-
-            logger.debug(
-                "build_description_jacket_carhart: col détecté type=%s matière=%s (raw=%s)",
-                collar_type,
-                collar_material,
-                collar_raw,
-            )
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("build_description_jacket_carhart: parsing col échoué (%s)", exc)
-            collar_type = ""
-            collar_material = ""
-
-        def _pick_percent_line(text: str) -> str:
-            try:
-                cleaned = _clean_carhartt_material_segment(text)
-                if not cleaned:
-                    return ""
-                matches = re.findall(r"\d+\s*%\s*[A-Za-zÀ-ÿ'’\- ]+", cleaned)
-                if matches:
-                    return " / ".join(m.strip() for m in matches)
-                return cleaned
-            except Exception as exc:  # pragma: no cover
-                logger.warning("_pick_percent_line: erreur (%s)", exc)
-                return _clean_carhartt_material_segment(text) or ""
+        collar_type, collar_material = _detect_collar(collar)
+        logger.debug(
+            "build_description_jacket_carhart: col détecté type=%s matière=%s (raw=%s)",
+            collar_type,
+            collar_material,
+            collar,
+        )
 
         # --- Warmth sentence: ne jamais injecter la composition dans la prose ---
         lining_label = ""
         try:
-            low = (lining or "").lower()
-
             # uniquement des libellés "qualitatifs", jamais des %/matières
-            if "matelass" in low or "quilt" in low:
+            if "matelass" in lining_low or "quilt" in lining_low:
                 lining_label = "doublure matelassée"
-            elif "sherpa" in low:
+            elif "sherpa" in lining_low:
                 lining_label = "doublure sherpa"
-            elif "blanket" in low or "laine" in low:
+            elif "blanket" in lining_low or "laine" in lining_low:
                 lining_label = "doublure type blanket"
             else:
                 lining_label = ""  # important : sinon risque "70% acrylique..."
@@ -587,18 +561,18 @@ def build_description_jacket_carhart(
 
         composition_lines: List[str] = []
 
-        ext_line = _pick_percent_line(exterior_raw or "")
+        ext_line = _pick_percent_line(exterior_raw or "", " / ")
         if ext_line:
             composition_lines.append(f"Extérieur : {ext_line}")
 
-        lining_line = _pick_percent_line(lining or "")
+        lining_line = _pick_percent_line(lining or "", " / ")
         if lining_line:
-            if "matelass" in (lining or "").lower() and ("(" in (lining or "") or "," in (lining or "")):
+            if "matelass" in lining_low and ("(" in lining or "," in lining):
                 composition_lines.append(f"Doublure : matelassée ({lining_line})")
             else:
                 composition_lines.append(f"Doublure : {lining_line}")
 
-        sleeve_line = _pick_percent_line(sleeve_lining_clean or "")
+        sleeve_line = _pick_percent_line(sleeve_lining_clean or "", " / ")
         if sleeve_line:
             composition_lines.append(f"Doublure des manches : {sleeve_line}")
 
@@ -621,7 +595,7 @@ def build_description_jacket_carhart(
 
         general_tag = "#durin31jc"
         size_tag = f"{general_tag}{size_token}" if size_token else "#durin31jcnc"
-        color_tag = f"#{color.lower().replace(' ', '')}" if color else ""
+        color_tag = f"#{color_low.replace(' ', '')}" if color else ""
 
         logistics_sentence = "📏 Mesures détaillées visibles en photo pour plus de précisions."
         shipping_sentence = "📦 Envoi rapide et soigné."
@@ -629,7 +603,7 @@ def build_description_jacket_carhart(
         bundle_sentence = "💡 Pensez à faire un lot pour bénéficier d’une réduction et économiser sur les frais d’envoi."
 
         hashtag_core = "#carhartt #jacket #workwear #durin31"
-        hashtags = " ".join(token for token in [hashtag_core, size_tag, color_tag] if token)
+        hashtags = " ".join(filter(None, (hashtag_core, size_tag, color_tag)))
 
         paragraphs = [
             product_sentence,
@@ -645,8 +619,9 @@ def build_description_jacket_carhart(
             hashtags,
         ]
 
-        description = "\n\n".join(part for part in paragraphs if part)
-        description = _safe_clean(description)
+        # Le premier et le dernier paragraphe sont toujours présents et sans
+        # blancs en bordure : un seul join suffit, sans nettoyage final.
+        description = "\n\n".join(filter(None, paragraphs))
         logger.debug("build_description_jacket_carhart: description générée = %s", description)
         return description
     except Exception as exc:  # pragma: no cover - robustesse
@@ -654,6 +629,14 @@ def build_description_jacket_carhart(
         return _safe_clean(ai_description)
 
 
+# Table de dispatch profil -> builder : une seule recherche par appel.
+_PROFILE_BUILDERS = {
+    AnalysisProfileName.JEAN_LEVIS: build_description_jean_levis,
+    AnalysisProfileName.PULL: build_description_pull,
+    AnalysisProfileName.JACKET_CARHART: build_description_jacket_carhart,
+}
+
+
 def build_description(
     profile_name: AnalysisProfileName,
     features: Dict[str, Any],
@@ -665,12 +648,9 @@ def build_description(
     Expose aussi des fonctions dédiées par profil pour clarifier la logique métier.
     """
     try:
-        if profile_name == AnalysisProfileName.JEAN_LEVIS:
-            return build_description_jean_levis(features, ai_description=ai_description, ai_defects=ai_defects)
-        if profile_name == AnalysisProfileName.PULL:
-            return build_description_pull(features, ai_description=ai_description, ai_defects=ai_defects)
-        if profile_name == AnalysisProfileName.JACKET_CARHART:
-            return build_description_jacket_carhart(features, ai_description=ai_description, ai_defects=ai_defects)
+        builder = _PROFILE_BUILDERS.get(profile_name)
+        if builder is not None:
+            return builder(features, ai_description=ai_description, ai_defects=ai_defects)
 
         fallback = (ai_description or "").strip()
         logger.debug("Profil %s non géré par le moteur de description, fallback brut.", profile_name)
@@ -682,3 +662,59 @@ def build_description(
             exc_info=True,
         )
         return (ai_description or "").strip()
+
+
+def _build_one(
+    profile_name: AnalysisProfileName,
+    features: Dict[str, Any],
+    ai_description: Optional[str] = None,
+    ai_defects: Optional[str] = None,
+) -> str:
+    """Construit une description (fonction de module, sérialisable pour les workers)."""
+    return build_description(profile_name, features, ai_description=ai_description, ai_defects=ai_defects)
+
+
+def build_descriptions_batch(
+    profile_name: AnalysisProfileName,
+    features_list: Sequence[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+    chunksize: int = 64,
+    ai_descriptions: Optional[Sequence[Optional[str]]] = None,
+    ai_defects_list: Optional[Sequence[Optional[str]]] = None,
+) -> List[str]:
+    """
+    Construit les descriptions d'un lot d'annonces d'un même profil.
+
+    Le traitement est en série par défaut : une description se construit en
+    quelques microsecondes, bien moins que le démarrage d'un pool de processus
+    et la sérialisation des features. Les lots ne sont répartis sur plusieurs
+    processus que si l'appelant le demande explicitement (`max_workers > 1`).
+    L'ordre des descriptions suit celui de `features_list`.
+
+    `ai_descriptions` / `ai_defects_list` (optionnels) sont alignés sur
+    `features_list` et transmis élément par élément aux builders.
+    """
+    count = len(features_list)
+    if ai_descriptions is None:
+        ai_descriptions = [None] * count
+    if ai_defects_list is None:
+        ai_defects_list = [None] * count
+    if len(ai_descriptions) != count or len(ai_defects_list) != count:
+        raise ValueError(
+            "build_descriptions_batch: ai_descriptions/ai_defects_list doivent "
+            "avoir la même longueur que features_list."
+        )
+
+    build = partial(_build_one, profile_name)
+    if max_workers is None or max_workers <= 1:
+        return list(map(build, features_list, ai_descriptions, ai_defects_list))
+
+    logger.info(
+        "build_descriptions_batch: %d annonces (%s) réparties sur plusieurs processus.",
+        count,
+        profile_name,
+    )
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(build, features_list, ai_descriptions, ai_defects_list, chunksize=chunksize)
+        )
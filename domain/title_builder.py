@@ -770,10 +770,7 @@ def build_jacket_carhart_title(features: Dict[str, Any]) -> str:
             parts.append(f"couleur {color}")
 
         if is_camouflage:
-            if is_realtree:
-                parts.append("Realtree")
-            else:
-                parts.append("camouflage")
+            parts.append("Realtree" if is_realtree else "camouflage")
         elif pattern and pattern.lower() == "camouflage":
             parts.append("camouflage")
 
@@ -20,7 +20,7 @@ import threading
 import traceback
 
 from config.log_config import setup_logging
-from config.settings import load_settings
+from config.settings import _load_dotenv_if_present, load_settings
 from domain.ai_provider import AIProviderName
 from infrastructure.ai_factory import build_providers
 from infrastructure.browser_bridge import start_bridge, stop_bridge
@@ -81,8 +81,15 @@ def main() -> None:
     args = parser.parse_args()
 
     # ------------------------------------------------------------------
-    # Logging (configurable via LOG_LEVEL env var, default: INFO)
+    # Logging (configurable via LOG_LEVEL / LOG_FORMAT, default: INFO)
     # ------------------------------------------------------------------
+    # Le .env est chargé avant le logging pour que LOG_LEVEL / LOG_FORMAT
+    # y soient pris en compte (load_settings le relit sans rien écraser).
+    try:
+        _load_dotenv_if_present()
+    except RuntimeError:
+        # L'erreur sera remontée et journalisée par load_settings ci-dessous.
+        pass
     log_level = _get_log_level()
     setup_logging(log_level)
     logger = logging.getLogger(__name__)
@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from domain.description_builder import (
+    _format_percent,
+    _format_rise_label,
+    _strip_footer_lines,
+    build_jean_levis_description,
+)
+
+
+class StripFooterLinesTest(TestCase):
+    def test_removes_footer_lines_and_collapses_blank_lines(self):
+        description = (
+            "Jean Levi's 501.\n"
+            "Marque : Levi's\n"
+            "  ** Couleur: bleu\n"
+            "\n"
+            "\n"
+            "- taille : 38   \n"
+            "SKU JLH12\n"
+            "Envoi rapide.  \n"
+        )
+
+        self.assertEqual(_strip_footer_lines(description), "Jean Levi's 501.\n\nEnvoi rapide.")
+
+    def test_keeps_lines_without_label_colon(self):
+        description = "Taille 38 équivalent W28\nMarque emblématique du denim"
+
+        self.assertEqual(_strip_footer_lines(description), description)
+
+    def test_removes_label_split_from_its_colon(self):
+        self.assertEqual(_strip_footer_lines("Texte\nmarque\n: Levi's\nFin"), "Texte\n\nFin")
+
+    def test_text_without_labels_only_gets_whitespace_cleanup(self):
+        self.assertEqual(
+            _strip_footer_lines("Pull doux.  \n\n\n\nEnvoi rapide.\t\n"),
+            "Pull doux.\n\nEnvoi rapide.",
+        )
+
+    def test_normalizes_non_breaking_spaces(self):
+        self.assertEqual(_strip_footer_lines("Prix\u00a0: 20\u00a0€\u00a0"), "Prix : 20 €")
+
+
+class FormatPercentTest(TestCase):
+    def test_returns_int_values_unchanged(self):
+        self.assertEqual(_format_percent(98), 98)
+
+    def test_parses_digit_strings(self):
+        self.assertEqual(_format_percent("98"), 98)
+        self.assertEqual(_format_percent(" 2 "), 2)
+
+    def test_truncates_numeric_strings_and_floats(self):
+        self.assertEqual(_format_percent("2.7"), 2)
+        self.assertEqual(_format_percent(99.9), 99)
+
+    def test_returns_none_for_empty_or_invalid_values(self):
+        self.assertIsNone(_format_percent(None))
+        self.assertIsNone(_format_percent(""))
+        self.assertIsNone(_format_percent("coton"))
+
+    def test_returns_none_for_values_overflowing_float(self):
+        self.assertIsNone(_format_percent(10**400))
+        self.assertIsNone(_format_percent("9" * 400))
+
+
+class FormatRiseLabelTest(TestCase):
+    def test_normalizes_rise_type_before_lookup(self):
+        self.assertEqual(_format_rise_label(" High ", None), "taille haute")
+        self.assertEqual(_format_rise_label("Taille basse", None), "taille basse")
+
+    def test_numeric_strings_and_numbers_give_the_same_label(self):
+        self.assertEqual(_format_rise_label(None, "22"), "taille basse")
+        self.assertEqual(_format_rise_label(None, 22), "taille basse")
+        self.assertEqual(_format_rise_label(None, 27.5), "taille haute")
+
+    def test_unusable_rise_cm_falls_back_to_mid_rise(self):
+        self.assertEqual(_format_rise_label(None, "n/a"), "taille moyenne")
+        self.assertEqual(_format_rise_label(None, [24]), "taille moyenne")
+
+    def test_non_string_rise_type_is_treated_as_missing(self):
+        self.assertEqual(_format_rise_label(1, None), "taille moyenne")
+        self.assertEqual(_format_rise_label({"value": "high"}, 22), "taille basse")
+
+    def test_huge_rise_cm_falls_back_to_mid_rise(self):
+        self.assertEqual(_format_rise_label(None, 10**400), "taille moyenne")
+
+
+class JeanLevisFallbackTest(TestCase):
+    def test_empty_features_return_the_ai_description_without_footer(self):
+        ai_description = "Jean Levi's 501 bleu.\n\nMarque : Levi's\nTaille : 38"
+
+        description = build_jean_levis_description({}, ai_description=ai_description)
+
+        self.assertIn("Jean Levi's 501 bleu.", description)
+        self.assertNotIn("Marque", description)
+        self.assertNotIn("Taille : 38", description)
+
+    def test_empty_features_keep_ai_defects_and_retail_price(self):
+        description = build_jean_levis_description(
+            {}, ai_description="Jean Levi's 501 bleu.", ai_defects="petite tache au genou"
+        )
+
+        self.assertIn("💵 Prix neuf en magasin :", description)
+        self.assertIn("👍 Très bon état : petite tache au genou", description)
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+from domain.description_engine import build_description, build_descriptions_batch
+from domain.templates import AnalysisProfileName
+
+
+class BuildDescriptionsBatchTest(TestCase):
+    def test_matches_single_builds_in_order(self):
+        features_list = [
+            {"brand": "Levi's", "model": "501", "size_fr": "38", "color": "bleu"},
+            {"brand": "Levi's", "model": "511 slim", "size_us": "W30", "length": "L32"},
+            {},
+        ]
+
+        self.assertEqual(
+            build_descriptions_batch(AnalysisProfileName.JEAN_LEVIS, features_list),
+            [build_description(AnalysisProfileName.JEAN_LEVIS, features) for features in features_list],
+        )
+
+    def test_forwards_ai_texts_per_item(self):
+        features_list = [{"brand": "Levi's", "model": "501"}, {}]
+        ai_descriptions = ["Jean 501 bleu.", "Description IA seule."]
+        ai_defects_list = ["petite tache", None]
+
+        self.assertEqual(
+            build_descriptions_batch(
+                AnalysisProfileName.JEAN_LEVIS,
+                features_list,
+                ai_descriptions=ai_descriptions,
+                ai_defects_list=ai_defects_list,
+            ),
+            [
+                build_description(
+                    AnalysisProfileName.JEAN_LEVIS, features, ai_description=ai_description, ai_defects=ai_defects
+                )
+                for features, ai_description, ai_defects in zip(features_list, ai_descriptions, ai_defects_list)
+            ],
+        )
+
+    def test_rejects_misaligned_ai_texts(self):
+        with self.assertRaises(ValueError):
+            build_descriptions_batch(AnalysisProfileName.PULL, [{}, {}], ai_descriptions=["x"])
+
+    def test_explicit_workers_use_the_process_pool_in_order(self):
+        features_list = [{"brand": "Levi's", "model": str(model)} for model in (501, 505, 511, 517)]
+
+        self.assertEqual(
+            build_descriptions_batch(AnalysisProfileName.JEAN_LEVIS, features_list, max_workers=2, chunksize=1),
+            build_descriptions_batch(AnalysisProfileName.JEAN_LEVIS, features_list),
+        )
+
+    def test_empty_batch(self):
+        self.assertEqual(build_descriptions_batch(AnalysisProfileName.PULL, []), [])
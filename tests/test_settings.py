@@ -0,0 +1,63 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from config.settings import _load_dotenv_if_present, load_settings, reset_settings_cache
+
+
+class LoadSettingsCacheTest(TestCase):
+    def setUp(self):
+        reset_settings_cache()
+        self.addCleanup(reset_settings_cache)
+
+    def test_load_settings_returns_cached_instance(self):
+        with mock.patch.dict(os.environ, {"GEMINI_API_KEY": "key-1", "GEMINI_MODEL": "model-a"}):
+            first = load_settings()
+            os.environ["GEMINI_MODEL"] = "model-b"
+            second = load_settings()
+
+        self.assertIs(first, second)
+        self.assertEqual(second.gemini_model, "model-a")
+
+    def test_reset_settings_cache_forces_reload(self):
+        with mock.patch.dict(os.environ, {"GEMINI_API_KEY": "key-1", "GEMINI_MODEL": "model-a"}):
+            first = load_settings()
+            os.environ["GEMINI_MODEL"] = "model-b"
+            reset_settings_cache()
+            second = load_settings()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.gemini_model, "model-b")
+
+
+class LoadDotenvTest(TestCase):
+    def test_dotenv_loads_missing_variables_only(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env_path = Path(tmp_dir) / ".env"
+            env_path.write_text(
+                "# commentaire\n\nVA_TEST_NEW = valeur \nVA_TEST_SET=depuis_fichier\n=orpheline\n",
+                encoding="utf-8",
+            )
+            with mock.patch.dict(os.environ, {"VA_TEST_SET": "depuis_env"}):
+                _load_dotenv_if_present(env_path)
+                self.assertEqual(os.environ["VA_TEST_NEW"], "valeur")
+                self.assertEqual(os.environ["VA_TEST_SET"], "depuis_env")
+
+    def test_missing_dotenv_is_ignored(self):
+        missing = "/nonexistent/path/.env"
+        reset_settings_cache()
+        self.addCleanup(reset_settings_cache)
+
+        with mock.patch.dict(os.environ, {"GEMINI_API_KEY": "key-1"}, clear=True):
+            _load_dotenv_if_present(missing)
+            self.assertEqual(dict(os.environ), {"GEMINI_API_KEY": "key-1"})
+
+            with mock.patch(
+                "config.settings._load_dotenv_if_present",
+                side_effect=lambda: _load_dotenv_if_present(missing),
+            ):
+                settings = load_settings()
+
+        self.assertEqual(settings.gemini_api_key, "key-1")
+        self.assertEqual(settings.gemini_model, "gemini-3-pro-preview")